@@ -808,7 +808,8 @@ class Mat(Arr):
         return Mat([~it for it in self._elem], self._dim.copy())
 
     def __deepcopy__(self, memodict: Dict = {}) -> Mat:
-        return Mat(deepcopy(self._elem), self._dim.copy())
+        # Elements of matrix are always vectors. Copy them directly rather than through generic deepcopy.
+        return Mat([it.__deepcopy__(memodict) for it in self._elem], self._dim.copy())
 
     def __str__(self) -> str:
         return 'Mat' + str(self._elem)
@@ -1113,26 +1114,43 @@ class Mat(Arr):
     # TODO: Need update?
 
     def rbind(self, v: Mat) -> Mat:
+        """
+        Binds v below the matrix.
+
+        It does not modify the matrix but returns a new one.
+        Rows are copied shallowly, so the result shares no vector with the operands.
+        This suffices since elements of vectors are immutable base types,
+        and it is much cheaper than deepcopy.
+
+        :param v: Vector or matrix to be bound.
+
+        :return: Bound matrix.
+        """
+        elem: List[Vec] = [Vec(it._elem[:]) for it in self._elem]
+
         if type(v) == Vec:
-            self.append(v)
+            elem.append(Vec(v._elem[:]))
         else:
-            self.append(v.elem)
+            elem += [Vec(it._elem[:]) for it in v._elem]
 
-        return self
+        return Mat(elem, [len(elem), self._dim[1]])
 
     def cbind(self, v: Mat) -> Mat:
-        if type(v) == Vec:
-            for i in range(self._dim[0]):
-                self._elem[i].append(v[i])
+        """
+        Binds v on the right side of the matrix.
 
-            self._dim[1] += 1
-        else:
-            for i in range(self._dim[0]):
-                self._elem[i].append(v[i].elem)
+        It does not modify the matrix but returns a new one with new rows.
 
-            self._dim[1] += v._dim[1]
+        :param v: Vector or matrix to be bound.
 
-        return self
+        :return: Bound matrix.
+        """
+        if type(v) == Vec:
+            return Mat([Vec(self._elem[i]._elem + [v[i]]) for i in range(self._dim[0])],
+                       [self._dim[0], self._dim[1] + 1])
+        else:
+            return Mat([Vec(self._elem[i]._elem + v._elem[i]._elem) for i in range(self._dim[0])],
+                       [self._dim[0], self._dim[1] + v._dim[1]])
 
     """
     GETTER & SETTER
@@ -1298,7 +1316,8 @@ class Vec(Mat):
         return Vec([not it for it in self._elem])
 
     def __deepcopy__(self, memodict: Dict = {}) -> Vec:
-        return Vec(deepcopy(self._elem))
+        # Elements of vector are base types which are immutable. Thus shallow copy of the list suffices.
+        return Vec(self._elem.copy())
 
     def __str__(self) -> str:
         return 'Vec' + str(self._elem)
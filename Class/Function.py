@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from Core.AST import *
 from Core.TypeSymbol import *
 
 
@@ -14,6 +15,10 @@ class Fun:
         else:
             self.__kwargs: List[Tuple[str, str]] = kwargs
 
+        # Parsed default values of keyword arguments, which are filled lazily by semantic checker.
+        # Since default values never change, each of them needs to be parsed only once.
+        self.__dflt: Dict[str, AST] = {}
+
     def is_kw(self, id_: str) -> bool:
         for k, _ in self.__kwargs:
             if k == id_:
@@ -33,6 +38,10 @@ class Fun:
     def kwargs(self) -> List[Tuple[str, str]]:
         return self.__kwargs
 
+    @property
+    def dflt(self) -> Dict[str, AST]:
+        return self.__dflt
+
     @property
     def nargs(self) -> int:
         return len(self.__t.args) - len(self.__kwargs)
@@ -14,6 +14,39 @@ class AST:
 
     This class is the end of inheritance. No further inheritance is allowed.
     """
+    __slots__ = ('__tok', '__ch', '__t', '__call', '__lval', '__chk')
+
+    # Routing tables for semantic checking logic.
+    # Since token types and operator types are contiguous small integers, tables are lists indexed by them.
+    # The first one is for non-operator tokens and the second one is for operator tokens.
+    # These tables are filled by semantic checker at initialization. (Refer to SemanticChk.init.)
+    __tok_chk: ClassVar[List[Optional[Callable]]] = [None] * (max(TokT) + 1)
+    __op_chk: ClassVar[List[Optional[Callable]]] = [None] * (max(OpT) + 1)
+
+    @classmethod
+    def route(cls, hndl: Callable, tok_t: TokT, op_t: Optional[OpT] = None) -> NoReturn:
+        """
+        Registers semantic checking logic for the nodes with given token type (and operator type).
+
+        :param hndl: Checking logic to be registered.
+        :param tok_t: Token type.
+        :param op_t: Operator type. Only used for operator tokens.
+        """
+        if tok_t == TokT.OP:
+            cls.__op_chk[op_t] = hndl
+        else:
+            cls.__tok_chk[tok_t] = hndl
+
+    @classmethod
+    def __lookup(cls, tok: Tok) -> Optional[Callable]:
+        """
+        Looks up semantic checking logic for the nodes with given token.
+
+        :param tok: Token of the node.
+
+        :return: Registered checking logic. None if there is no such one.
+        """
+        return cls.__op_chk[tok.v] if tok.t == TokT.OP else cls.__tok_chk[tok.t]
 
     def __init__(self, tok: Tok, ch: List[AST] = None, t: TSym = None, call: Optional[Callable] = None,
                  lval: bool = False) -> None:
@@ -29,6 +62,8 @@ class AST:
         self.__call: Optional[Callable] = call
         # Flag indicating whether the node is l-value or not.
         self.__lval: bool = lval
+        # Semantic checking logic for the node. Looked up on first use.
+        self.__chk: Optional[Callable] = None
 
     """
     BUILT-IN OVERRIDING
@@ -41,6 +76,21 @@ class AST:
 
     __repr__ = __str__
 
+    """
+    UTIL
+    """
+
+    def clone(self) -> AST:
+        """
+        Clones the subtree rooted at the node with fresh nodes and tokens.
+
+        Only tokens and structure are cloned. Fields assigned by semantic checker are left empty,
+        since the clone is to be checked again.
+
+        :return: Root of cloned subtree.
+        """
+        return AST(Tok(self.__tok.t, self.__tok.v, self.__tok.pos), [node.clone() for node in self.__ch])
+
     """
     GETTER & SETTER
     """
@@ -65,9 +115,22 @@ class AST:
     def lval(self) -> bool:
         return self.__lval
 
+    @property
+    def chk(self) -> Callable:
+        # Routing tables are filled by SemanticChk.init, so it is looked up here rather than at construction.
+        if self.__chk is None:
+            self.__chk = AST.__lookup(self.__tok)
+
+            if self.__chk is None:
+                raise RuntimeError(f'No semantic checking logic is routed for {self.__tok}. '
+                                   f'SemanticChk.init must be called before checking.')
+
+        return self.__chk
+
     @tok.setter
     def tok(self, tok: Tok) -> NoReturn:
         self.__tok = tok
+        self.__chk = None
 
     @ch.setter
     def ch(self, ch: List[AST]) -> NoReturn:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import signal
 from Util.Reader import *
 from Function.Matrix import *
+from .SemanticChecker import *
 
 
 @final
@@ -40,3 +41,4 @@ class InitMan:
 
         CLib.init()
         MatFun.init()
+        SemanticChk.init()
@@ -29,6 +29,19 @@ class Interp:
     def __init__(self) -> None:
         self.__ast: Optional[AST] = None
         self.__line: str = ''
+        # Symbol table.
+        self.__sym_tab: Optional[SymTab] = None
+        # Interpreting logic for each token type, indexed by token type.
+        # Terminal nodes other than Var need no interpretation, and thus they have no entries.
+        self.__tok_hndl: List[Optional[Callable]] = [None] * (max(TokT) + 1)
+        self.__tok_hndl[TokT.VAR] = self.__interp_var
+        self.__tok_hndl[TokT.MEM] = self.__interp_mem
+        self.__tok_hndl[TokT.ARR] = self.__interp_arr
+        self.__tok_hndl[TokT.STRT] = self.__interp_strt
+        self.__tok_hndl[TokT.FUN] = self.__interp_fun
+        # Interpreting logic for operator tokens, indexed by operator type.
+        self.__op_hndl: List[Callable] = [self.__interp_op] * (max(OpT) + 1)
+        self.__op_hndl[OpT.ASGN] = self.__interp_asgn
 
     """
     INTERPRETING LOGIC
@@ -57,18 +70,18 @@ class Interp:
         self.__interp_hlpr(ast.ch[0])
 
         if type(ast.ch[0].tok.v) == str:
-            SymTab.inst().update_v(ast.ch[0].tok.v, ast.ch[1].tok.v)
+            self.__sym_tab.update_v(ast.ch[0].tok.v, ast.ch[1].tok.v)
             ast.tok.v = ast.ch[1].tok.v
         else:
             id_, idx = ast.ch[0].tok.v
-            tar, val = SymTab.inst().lookup_v(id_), ast.ch[1].tok.v
+            tar, val = self.__sym_tab.lookup_v(id_), ast.ch[1].tok.v
 
             if ast.ch[0].t.t == T.ARR and ast.ch[1].t.t == T.ARR:
                 val = val.promote(ast.ch[0].t.dept - val.dept)
 
             try:
                 if isinstance(tar, Arr):
-                    SymTab.inst().update_v(id_, tar.update(idx, val))
+                    self.__sym_tab.update_v(id_, tar.update(idx, val))
                 else:
                     # A little trick here.
                     # When base type is indexed and then assigned,
@@ -77,7 +90,7 @@ class Interp:
                     # After the assignment, we need to degrade it back to keep base type as base type.
                     tar = Vec([tar]).update(idx, val)
 
-                    SymTab.inst().update_v(id_, tar.degrade(tar.dept))
+                    self.__sym_tab.update_v(id_, tar.degrade(tar.dept))
             except InterpErr as e:
                 e.pos = ast.tok.pos
                 e.line = self.__line
@@ -127,49 +140,52 @@ class Interp:
 
         ast.tok.v = Strt({node.tok.v[0]: node.tok.v[1] for node in ast.ch}, [node.tok.v[0] for node in ast.ch])
 
+    def __interp_var(self, ast: AST) -> NoReturn:
+        # Lookup symbol table and retrieve assigned value.
+        if not ast.lval:
+            ast.tok.v = self.__sym_tab.lookup_v(ast.tok.v)
+
+    def __interp_mem(self, ast: AST) -> NoReturn:
+        self.__interp_hlpr(ast.ch[0])
+
+        ast.tok.v = (ast.tok.v, ast.ch[0].tok.v)
+
+    def __interp_fun(self, ast: AST) -> NoReturn:
+        for node in ast.ch:
+            self.__interp_hlpr(node)
+
+        try:
+            ast.tok.v = ast.call(*[node.tok.v for node in ast.ch])
+        except InterpErr as e:
+            e.pos = ast.tok.pos
+            e.line = self.__line
+
+            raise e
+        except Exception as e:
+            raise InterpErr(ast.tok.pos, self.__line, Errno.KERNEL_ERR, k_msg=str(e))
+
     def __interp_hlpr(self, ast: AST) -> NoReturn:
         """
         Traverses AST and interprets.
 
+        Interpreting logic is looked up from the tables indexed by token type (and operator type),
+        rather than by chained comparisons.
+
         :param ast: AST to be interpreted.
 
         :raise InterpErr: Expression containing functionality which is not implemented yet raises exception
                           with errno NOT_IMPLE.
         :raise InterpErr: If kernel raises exception during computation, it raises exception with errno KERNEL_ERR.
         """
-        # Lookup symbol table and retrieve assigned value.
-        if ast.tok.t == TokT.VAR and not ast.lval:
-            ast.tok.v = SymTab.inst().lookup_v(ast.tok.v)
-
-        elif ast.tok.t == TokT.MEM:
-            self.__interp_hlpr(ast.ch[0])
-
-            ast.tok.v = (ast.tok.v, ast.ch[0].tok.v)
-
         # OP token with ASGN or EXP is right to left associative.
-        # Thus, the rightmost child should be interpreted first.
-        elif ast.tok.t == TokT.OP:
-            if ast.tok.v == OpT.ASGN:
-                self.__interp_asgn(ast)
-            else:
-                self.__interp_op(ast)
-        elif ast.tok.t == TokT.ARR:
-            self.__interp_arr(ast)
-        elif ast.tok.t == TokT.STRT:
-            self.__interp_strt(ast)
-        elif ast.tok.t == TokT.FUN:
-            for node in ast.ch:
-                self.__interp_hlpr(node)
-
-            try:
-                ast.tok.v = ast.call(*[node.tok.v for node in ast.ch])
-            except InterpErr as e:
-                e.pos = ast.tok.pos
-                e.line = self.__line
+        # Thus, the rightmost child should be interpreted first. (Refer to the logic for each.)
+        if ast.tok.t is TokT.OP:
+            self.__op_hndl[ast.tok.v](ast)
+        else:
+            hndl: Optional[Callable] = self.__tok_hndl[ast.tok.t]
 
-                raise e
-            except Exception as e:
-                raise InterpErr(ast.tok.pos, self.__line, Errno.KERNEL_ERR, k_msg=str(e))
+            if hndl is not None:
+                hndl(ast)
 
     def interp(self, ast: AST, line: str) -> str:
         """
@@ -182,6 +198,7 @@ class Interp:
         """
         self.__ast = ast
         self.__line = line
+        self.__sym_tab = SymTab.inst()
 
         self.__interp_hlpr(self.__ast)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from timeit import default_timer as timer
 from .Token import *
 from .SymbolTable import *
@@ -39,11 +40,14 @@ class Lexer:
         self.__pos: int = 0
         # Character in the raw input string pointed by self.__pos.
         self.__curr_char: Optional[str] = None
+        # Symbol table.
+        self.__sym_tab: Optional[SymTab] = None
 
     def init(self, line: str) -> NoReturn:
         self.__line: str = line
         self.__pos: int = 0
         self.__curr_char: Optional[str] = line[0]
+        self.__sym_tab: Optional[SymTab] = SymTab.inst()
 
     """
     HELPER FOR TOKEN DERIVING LOGIC
@@ -168,10 +172,12 @@ class Lexer:
         while self.__curr_char and (self.__curr_char.isalnum() or self.__curr_char == '_'):
             self.__step()
 
-        tv_pair = SymTab.inst().lookup_kw(self.__line[pivot:self.__pos])
+        # Ids are interned so that lookups in symbol table can be done by pointer comparison.
+        id_: str = sys.intern(self.__line[pivot:self.__pos])
+        tv_pair = self.__sym_tab.lookup_kw(id_)
 
         if not tv_pair:
-            return Tok(TokT.VAR, self.__line[pivot:self.__pos], pivot)
+            return Tok(TokT.VAR, id_, pivot)
 
         return Tok(*tv_pair, pos=pivot)
 
@@ -385,7 +391,7 @@ class Lexer:
         print('--------- RESULT ---------')
 
         for i in range(len(res)):
-            print(f'[{i}] {res[i]}')
+            print(f'[{i}] {res[i].describe()}')
 
 
 """
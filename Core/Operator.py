@@ -49,10 +49,10 @@ class Arith:
         if sup_t is None:
             return None
 
-        if sup_t.base and sup_t <= NumTSym():
-            return NumTSym()
-        elif sup_t.t == T.ARR and sup_t.elem <= NumTSym():
-            return ArrTSym(NumTSym(), sup_t.dept)
+        if sup_t.base and sup_t <= NUM_T:
+            return NUM_T
+        elif sup_t.t == T.ARR and sup_t.elem <= NUM_T:
+            return ArrTSym(NUM_T, sup_t.dept)
 
         return None
 
@@ -65,9 +65,9 @@ class Arith:
         op t => Arr[Num, n] if t = Arr[a, n] and a <: Num
         """
         if t.base:
-            return NumTSym() if t <= NumTSym() else None
+            return NUM_T if t <= NUM_T else None
         elif t.t == T.ARR:
-            return ArrTSym(NumTSym(), t.dept) if t.elem <= NumTSym() else None
+            return ArrTSym(NUM_T, t.dept) if t.elem <= NUM_T else None
 
         return None
 
@@ -87,17 +87,17 @@ class Arith:
             return None
 
         if sup_t.base:
-            if sup_t <= NumTSym():
-                return NumTSym()
-            elif sup_t == StrTSym():
-                return StrTSym()
+            if sup_t <= NUM_T:
+                return NUM_T
+            elif sup_t == STR_T:
+                return STR_T
             else:
                 return None
         elif sup_t.t == T.ARR:
-            if sup_t.elem <= NumTSym():
-                return ArrTSym(NumTSym(), sup_t.dept)
-            elif sup_t.elem == StrTSym():
-                return ArrTSym(StrTSym(), sup_t.dept)
+            if sup_t.elem <= NUM_T:
+                return ArrTSym(NUM_T, sup_t.dept)
+            elif sup_t.elem == STR_T:
+                return ArrTSym(STR_T, sup_t.dept)
             else:
                 return None
 
@@ -115,18 +115,18 @@ class Arith:
         Arr[Str, m] * Arr[Num, n] => Arr[Str, max(m, n)]
         """
         if t1.base:
-            if t2.base and ((t1 <= NumTSym() and t2 == StrTSym()) or (t2 <= NumTSym() and t1 == StrTSym())):
-                return StrTSym()
+            if t2.base and ((t1 <= NUM_T and t2 == STR_T) or (t2 <= NUM_T and t1 == STR_T)):
+                return STR_T
             elif t2.t == T.ARR and \
-                    ((t1 <= NumTSym() and t2.elem == StrTSym()) or (t2.elem <= NumTSym() and t1 == StrTSym())):
-                return ArrTSym(StrTSym(), t2.dept)
+                    ((t1 <= NUM_T and t2.elem == STR_T) or (t2.elem <= NUM_T and t1 == STR_T)):
+                return ArrTSym(STR_T, t2.dept)
         elif t1.t == T.ARR:
-            if t2.base and ((t1.elem <= NumTSym() and t2 == StrTSym()) or (t2 <= NumTSym() and t1.elem == StrTSym())):
-                return ArrTSym(StrTSym(), t1.dept)
+            if t2.base and ((t1.elem <= NUM_T and t2 == STR_T) or (t2 <= NUM_T and t1.elem == STR_T)):
+                return ArrTSym(STR_T, t1.dept)
             elif t2.t == T.ARR and \
-                    ((t1.elem <= NumTSym() and t2.elem == StrTSym()) or
-                     (t2.elem <= NumTSym() and t1.elem == StrTSym())):
-                return ArrTSym(StrTSym(), max(t1.dept, t2.dept))
+                    ((t1.elem <= NUM_T and t2.elem == STR_T) or
+                     (t2.elem <= NUM_T and t1.elem == STR_T)):
+                return ArrTSym(STR_T, max(t1.dept, t2.dept))
 
         return Arith.__t_chk_hlpr_bin(t1, t2)
 
@@ -152,7 +152,7 @@ class Arith:
 
         t1:t2 => Arr[Num, 1] if t1, t2 <: Num
         """
-        return ArrTSym(NumTSym(), 1) if t1 <= NumTSym() and t2 <= NumTSym() else None
+        return ArrTSym(NUM_T, 1) if t1 <= NUM_T and t2 <= NUM_T else None
 
     @staticmethod
     def t_chk(op: OpT, arg: List[TSym]) -> Tuple[Optional[TSym], Optional[Callable]]:
@@ -232,10 +232,10 @@ class Comp:
         if sup_t is None:
             return None
 
-        if sup_t.base and (sup_t <= NumTSym() or sup_t == StrTSym()):
-            return BoolTSym()
-        elif sup_t.t == T.ARR and (sup_t.elem <= NumTSym() or sup_t.elem == StrTSym()):
-            return ArrTSym(BoolTSym(), sup_t.dept)
+        if sup_t.base and (sup_t <= NUM_T or sup_t == STR_T):
+            return BOOL_T
+        elif sup_t.t == T.ARR and (sup_t.elem <= NUM_T or sup_t.elem == STR_T):
+            return ArrTSym(BOOL_T, sup_t.dept)
 
         return None
 
@@ -299,10 +299,10 @@ class Logi:
         if sup_t is None:
             return None
 
-        if sup_t.base and sup_t <= NumTSym():
-            return BoolTSym()
-        elif sup_t.t == T.ARR and sup_t.elem <= NumTSym():
-            return ArrTSym(BoolTSym(), sup_t.dept)
+        if sup_t.base and sup_t <= NUM_T:
+            return BOOL_T
+        elif sup_t.t == T.ARR and sup_t.elem <= NUM_T:
+            return ArrTSym(BOOL_T, sup_t.dept)
 
         return None
 
@@ -315,9 +315,9 @@ class Logi:
         op t => Arr[Bool, n] if t = Arr[a, n] and a <: Num
         """
         if t.base:
-            return BoolTSym() if t <= NumTSym() else None
+            return BOOL_T if t <= NUM_T else None
         elif t.t == T.ARR:
-            return ArrTSym(BoolTSym(), t.dept) if t.elem <= NumTSym() else None
+            return ArrTSym(BOOL_T, t.dept) if t.elem <= NUM_T else None
 
         return None
 
@@ -404,11 +404,11 @@ class Sp:
         dept: int = max(t1.dept, len(t2)) if t1.t == T.ARR else len(t2)
 
         for t in t2:
-            if t == VoidTSym():
+            if t == VOID_T:
                 continue
-            elif t <= NumTSym():
+            elif t <= NUM_T:
                 dept -= 1
-            elif t <= ArrTSym(NumTSym(), 1):
+            elif t <= ArrTSym(NUM_T, 1):
                 continue
             else:
                 return None
@@ -19,6 +19,11 @@ class Parser:
     """
     # Singleton object.
     __inst: ClassVar[Parser] = None
+    # Sets of operators sharing the same precedence and tokens which are terminals by themselves.
+    # Membership tests on sets are done by hashing, rather than by linear scan over lists built at every test.
+    __COMP_OP: Final[ClassVar[FrozenSet[OpT]]] = frozenset([OpT.LSS, OpT.LEQ, OpT.GRT, OpT.GEQ, OpT.EQ, OpT.NEQ])
+    __REM_OP: Final[ClassVar[FrozenSet[OpT]]] = frozenset([OpT.MATMUL, OpT.MOD, OpT.QUOT])
+    __LIT_TOK: Final[ClassVar[FrozenSet[TokT]]] = frozenset([TokT.NUM, TokT.BOOL, TokT.STR, TokT.VAR])
 
     @classmethod
     def inst(cls, *args, **kwargs) -> Parser:
@@ -32,6 +37,10 @@ class Parser:
         self.__line: str = ''
         # Token received from lexer. This field is automatically managed internally.
         self.__curr_tok: Optional[Tok] = None
+        # Operator type of the current token. None if the current token is not an operator token.
+        # Since most tests in parsing logic are for specific operators, it is cached to avoid comparing token type
+        # and operator type separately at every test. This field is automatically managed internally.
+        self.__curr_op: Optional[OpT] = None
 
     """
     HELPER FOR PARSING LOGIC
@@ -44,6 +53,7 @@ class Parser:
         Get next token to process from lexer and set the received one as a current token.
         """
         self.__curr_tok = Lexer.inst().next_tok()
+        self.__curr_op = self.__curr_tok.v if self.__curr_tok.t == TokT.OP else None
 
     """
     PARSING LOGIC
@@ -123,7 +133,7 @@ class Parser:
         """
         rt: AST = self.__or_expr()
 
-        if self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.ASGN:
+        if self.__curr_op is OpT.ASGN:
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
@@ -137,7 +147,7 @@ class Parser:
         """
         rt: AST = self.__and_expr()
 
-        while self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.OR:
+        while self.__curr_op is OpT.OR:
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
@@ -151,7 +161,7 @@ class Parser:
         """
         rt: AST = self.__neg_expr()
 
-        while self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.AND:
+        while self.__curr_op is OpT.AND:
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
@@ -163,7 +173,7 @@ class Parser:
         """
         neg_expr = NEG* comp_expr
         """
-        if self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.NEG:
+        if self.__curr_op is OpT.NEG:
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
@@ -178,8 +188,7 @@ class Parser:
         """
         rt: AST = self.__add_expr()
 
-        while self.__curr_tok.t == TokT.OP and \
-                self.__curr_tok.v in [OpT.LSS, OpT.LEQ, OpT.GRT, OpT.GEQ, OpT.EQ, OpT.NEQ]:
+        while self.__curr_op in Parser.__COMP_OP:
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
@@ -193,7 +202,7 @@ class Parser:
         """
         rt: AST = self.__mul_expr()
 
-        while self.__curr_tok.t == TokT.OP and (self.__curr_tok.v == OpT.ADD or self.__curr_tok.v == OpT.SUB):
+        while (self.__curr_op is OpT.ADD or self.__curr_op is OpT.SUB):
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
@@ -207,7 +216,7 @@ class Parser:
         """
         rt: AST = self.__rem_expr()
 
-        while self.__curr_tok.t == TokT.OP and (self.__curr_tok.v == OpT.MUL or self.__curr_tok.v == OpT.DIV):
+        while (self.__curr_op is OpT.MUL or self.__curr_op is OpT.DIV):
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
@@ -221,7 +230,7 @@ class Parser:
         """
         rt: AST = self.__seq_expr()
 
-        while self.__curr_tok.t == TokT.OP and self.__curr_tok.v in [OpT.MATMUL, OpT.MOD, OpT.QUOT]:
+        while self.__curr_op in Parser.__REM_OP:
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
@@ -235,7 +244,7 @@ class Parser:
         """
         rt: AST = self.__pls_expr()
 
-        while self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.SEQ:
+        while self.__curr_op is OpT.SEQ:
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
@@ -247,13 +256,13 @@ class Parser:
         """
         pls_expr = (ADD | SUB)* exp_expr
         """
-        if self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.ADD:
+        if self.__curr_op is OpT.ADD:
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
 
             return AST(rt_tok, [self.__pls_expr()])
-        elif self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.SUB:
+        elif self.__curr_op is OpT.SUB:
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
@@ -268,7 +277,7 @@ class Parser:
         """
         rt: AST = self.__idx_expr()
 
-        if self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.EXP:
+        if self.__curr_op is OpT.EXP:
             rt_tok: Tok = self.__curr_tok
 
             self.__eat()
@@ -285,38 +294,38 @@ class Parser:
         """
         rt: AST = self.__term()
 
-        while self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.IDX:
+        while self.__curr_op is OpT.IDX:
             rt_tok: Tok = self.__curr_tok
             idx: List[AST] = []
 
             self.__eat()
 
-            if self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.RBRA:
+            if self.__curr_op is OpT.RBRA:
                 idx.append(AST(Tok(TokT.VOID, pos=self.__curr_tok.pos)))
                 self.__eat()
 
                 rt = AST(rt_tok, [rt, *idx])
 
                 continue
-            elif self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.COM:
+            elif self.__curr_op is OpT.COM:
                 idx.append(AST(Tok(TokT.VOID, pos=self.__curr_tok.pos)))
             else:
                 idx.append(self.__expr())
 
-            while self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.COM:
+            while self.__curr_op is OpT.COM:
                 self.__eat()
 
-                if self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.RBRA:
+                if self.__curr_op is OpT.RBRA:
                     idx.append(AST(Tok(TokT.VOID, pos=self.__curr_tok.pos)))
 
                     break
-                elif self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.COM:
+                elif self.__curr_op is OpT.COM:
                     idx.append(AST(Tok(TokT.VOID, pos=self.__curr_tok.pos)))
                     self.__eat()
                 else:
                     idx.append(self.__expr())
 
-            if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.RBRA:
+            if self.__curr_op is not OpT.RBRA:
                 raise ParserErr(rt_tok.pos, self.__line, Errno.NCLOSED_PARN)
 
             self.__eat()
@@ -341,24 +350,24 @@ class Parser:
         """
         rt_tok: Tok = self.__curr_tok
 
-        if rt_tok.t == TokT.OP and rt_tok.v == OpT.LPAR:
+        if self.__curr_op is OpT.LPAR:
             self.__eat()
 
             rt: AST = self.__expr()
 
-            if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.RPAR:
+            if self.__curr_op is not OpT.RPAR:
                 raise ParserErr(rt_tok.pos, self.__line, Errno.NCLOSED_PARN)
 
             self.__eat()
 
             return rt
-        elif rt_tok.t == TokT.OP and rt_tok.v == OpT.LBRA:
+        elif self.__curr_op is OpT.LBRA:
             return self.__arr_expr()
-        elif rt_tok.t == TokT.OP and rt_tok.v == OpT.LCUR:
+        elif self.__curr_op is OpT.LCUR:
             return self.__strt_expr()
         elif rt_tok.t == TokT.FUN:
             return self.__fun_expr()
-        elif rt_tok.t in [TokT.NUM, TokT.BOOL, TokT.STR, TokT.VAR]:
+        elif rt_tok.t in Parser.__LIT_TOK:
             self.__eat()
 
             return AST(rt_tok)
@@ -379,14 +388,14 @@ class Parser:
 
         self.__eat()
 
-        if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.RBRA:
+        if self.__curr_op is not OpT.RBRA:
             elem.append(self.__expr())
 
-        while self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.COM:
+        while self.__curr_op is OpT.COM:
             self.__eat()
             elem.append(self.__expr())
 
-        if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.RBRA:
+        if self.__curr_op is not OpT.RBRA:
             raise ParserErr(rt_tok.pos, self.__line, Errno.NCLOSED_PARN)
 
         self.__eat()
@@ -406,7 +415,7 @@ class Parser:
 
         self.__eat()
 
-        if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.RCUR:
+        if self.__curr_op is not OpT.RCUR:
             if self.__curr_tok.t != TokT.VAR:
                 raise ParserErr(self.__curr_tok.pos, self.__line, Errno.MEMID_MISS)
 
@@ -414,13 +423,13 @@ class Parser:
 
             self.__eat()
 
-            if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.SEQ:
+            if self.__curr_op is not OpT.SEQ:
                 raise ParserErr(self.__curr_tok.pos, self.__line, Errno.INCOMP_EXPR)
 
             self.__eat()
             elem.append(AST(Tok(TokT.MEM, id_tok.v, id_tok.pos), [self.__expr()]))
 
-            while self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.COM:
+            while self.__curr_op is OpT.COM:
                 self.__eat()
 
                 if self.__curr_tok.t != TokT.VAR:
@@ -430,13 +439,13 @@ class Parser:
 
                 self.__eat()
 
-                if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.SEQ:
+                if self.__curr_op is not OpT.SEQ:
                     raise ParserErr(self.__curr_tok.pos, self.__line, Errno.INCOMP_EXPR)
 
                 self.__eat()
                 elem.append(AST(Tok(TokT.MEM, id_tok.v, id_tok.pos), [self.__expr()]))
 
-        if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.RCUR:
+        if self.__curr_op is not OpT.RCUR:
             raise ParserErr(rt_tok.pos, self.__line, Errno.NCLOSED_PARN)
 
         self.__eat()
@@ -469,28 +478,28 @@ class Parser:
 
         self.__eat()
 
-        if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.LPAR:
+        if self.__curr_op is not OpT.LPAR:
             raise ParserErr(rt_tok.pos, self.__line, Errno.FUN_CALL_MISS)
 
         paren_start: int = self.__curr_tok.pos
 
         self.__eat()
 
-        if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.RPAR:
+        if self.__curr_op is not OpT.RPAR:
             if self.__curr_tok.t != TokT.VAR or not fun.is_kw(self.__curr_tok.v):
                 args.append(self.__expr())
 
-                while self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.COM:
+                while self.__curr_op is OpT.COM:
                     self.__eat()
 
                     if self.__curr_tok.t == TokT.VAR and fun.is_kw(self.__curr_tok.v):
                         break
-                    elif self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.RPAR:
+                    elif self.__curr_op is OpT.RPAR:
                         raise ParserErr(self.__curr_tok.pos, self.__line, Errno.INCOMP_EXPR)
 
                     args.append(self.__expr())
 
-                if self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.RPAR:
+                if self.__curr_op is OpT.RPAR:
                     self.__eat()
 
                     return AST(rt_tok, args)
@@ -502,13 +511,13 @@ class Parser:
 
             self.__eat()
 
-            if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.ASGN:
+            if self.__curr_op is not OpT.ASGN:
                 raise ParserErr(self.__curr_tok.pos, self.__line, Errno.INCOMP_EXPR)
 
             self.__eat()
             kwargs.append(AST(Tok(TokT.KWARG, id_tok.v, id_tok.pos), [self.__expr()]))
 
-            while self.__curr_tok.t == TokT.OP and self.__curr_tok.v == OpT.COM:
+            while self.__curr_op is OpT.COM:
                 self.__eat()
 
                 if self.__curr_tok.t != TokT.VAR or not fun.is_kw(self.__curr_tok.v):
@@ -518,13 +527,13 @@ class Parser:
 
                 self.__eat()
 
-                if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.ASGN:
+                if self.__curr_op is not OpT.ASGN:
                     raise ParserErr(self.__curr_tok.pos, self.__line, Errno.INCOMP_EXPR)
 
                 self.__eat()
                 kwargs.append(AST(Tok(TokT.KWARG, id_tok.v, id_tok.pos), [self.__expr()]))
 
-        if self.__curr_tok.t != TokT.OP or self.__curr_tok.v != OpT.RPAR:
+        if self.__curr_op is not OpT.RPAR:
             raise ParserErr(paren_start, self.__line, Errno.NCLOSED_PARN)
 
         self.__eat()
@@ -548,7 +557,7 @@ class Parser:
 
         Lexer.inst().init(line)
 
-        self.__curr_tok = Lexer.inst().next_tok()
+        self.__eat()
 
         if self.__curr_tok.t == TokT.EOF:
             return None
@@ -581,7 +590,7 @@ class Parser:
         for node in ast.ch:
             cnt = self.__test_hlpr(node, cnt)
 
-        print(f'[{cnt}] {ast.tok}')
+        print(f'[{cnt}] {ast.tok.describe()}')
 
         return cnt + 1
 
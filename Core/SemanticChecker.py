@@ -4,10 +4,16 @@ from .Operator import *
 from .Parser import *
 from Error.Exception import *
 
+if __debug__:
+    from .SemanticCheckerTest import *
+else:
+    # Debugging routines are stripped in optimized mode(python -O).
+    SemanticChkTest = object
+
 
 # TODO: kwargs unnecessary/duplicated, member id duplicated?
 @final
-class SemanticChk:
+class SemanticChk(SemanticChkTest):
     """
     Semantic checker class.
 
@@ -22,8 +28,21 @@ class SemanticChk:
     This class is implemented as a singleton. The singleton object will be instantiated at its first call.
     This class is the end of inheritance. No further inheritance is allowed.
     """
+    __slots__ = ('__ast', '__line', '__sgntr_cache', '__sym_tab', '__var_t', '__t_chk_memo')
+
     # Singleton object.
     __inst: ClassVar[SemanticChk] = None
+    # NA type of undefined variables.
+    # Since type symbols are never modified once constructed, it is shared by all such variables.
+    __NA_T: Final[ClassVar[TSym]] = TSym()
+    # Type checking logic for operators in Operator module, indexed by operator types.
+    # Only arithmetic, comparison, and boolean operators have entries. (Refer to SemanticChk.__chk_op.)
+    __OP_T_CHK: Final[ClassVar[List[Optional[Callable]]]] = \
+        [None] + [Arith.t_chk if op <= OpT.DIV else
+                  Comp.t_chk if op <= OpT.NEQ else
+                  Logi.t_chk if op <= OpT.OR else None for op in OpT]
+    # Maximum # of entries of the signature cache. If it is exceeded, the cache is flushed.
+    __SGNTR_CACHE_SZ: Final[ClassVar[int]] = 4096
 
     @classmethod
     def inst(cls, *args, **kwargs) -> SemanticChk:
@@ -32,11 +51,48 @@ class SemanticChk:
 
         return cls.__inst
 
+    @staticmethod
+    def init() -> NoReturn:
+        """
+        Registers checking logic for each type of node to the routing table of AST class.
+
+        It should be called before parsing, since the routing is done when AST nodes are constructed.
+        """
+        AST.route(SemanticChk.__chk_num, TokT.NUM)
+        AST.route(SemanticChk.__chk_bool, TokT.BOOL)
+        AST.route(SemanticChk.__chk_str, TokT.STR)
+        AST.route(SemanticChk.__chk_void, TokT.VOID)
+        AST.route(SemanticChk.__chk_var, TokT.VAR)
+        AST.route(SemanticChk.__chk_kwarg, TokT.KWARG)
+        AST.route(SemanticChk.__chk_mem, TokT.MEM)
+        AST.route(SemanticChk.__chk_arr, TokT.ARR)
+        AST.route(SemanticChk.__chk_strt, TokT.STRT)
+        AST.route(SemanticChk.__chk_fun, TokT.FUN)
+
+        for op in OpT:
+            AST.route(SemanticChk.__chk_op, TokT.OP, op)
+
+        AST.route(SemanticChk.__chk_idx, TokT.OP, OpT.IDX)
+        AST.route(SemanticChk.__chk_asgn, TokT.OP, OpT.ASGN)
+
     def __init__(self) -> None:
         # AST to be checked.
         self.__ast: Optional[AST] = None
         # Raw input string.
         self.__line: str = ''
+        # Cache for signature checks of function calls. (Refer to SemanticChk.__chk_fun.)
+        # Keys are ids of the function type and argument types,
+        # and values are those types themselves, which keep their ids from being reused, with the check result.
+        self.__sgntr_cache: Dict[Tuple[int, ...], Tuple[TSym, List[TSym], bool]] = {}
+        # Symbol table.
+        self.__sym_tab: Optional[SymTab] = None
+        # Types of variables which are already looked up during the current check.
+        # It is valid only within a single check since the environment changes b/w checks.
+        self.__var_t: Dict[str, TSym] = {}
+        # Results of type checking logic in Operator module during the current check.
+        # Keys are operator types (with l-value flag for indexing) and ids of the argument types.
+        # Since argument types are attached to the nodes of AST being checked, their ids are not reused.
+        self.__t_chk_memo: Dict[Tuple[int, ...], Tuple[Optional[TSym], Optional[Callable]]] = {}
 
     """
     SEMANTIC CHECKING LOGIC
@@ -110,6 +166,29 @@ class SemanticChk:
     Most of this logic is for internal use only.
     """
 
+    def __ch_t(self, ast: AST) -> List[TSym]:
+        """
+        Collects types of children of ast.
+
+        [ChkVar] Types of children should not be NA.
+        Since NA types are rare, children are scanned by builtin any first,
+        and the offending child is located only when there is one.
+
+        :param ast: AST whose children are already checked.
+
+        :return: List of types of children.
+
+        :raise SemanticErr[NOT_DEFINE]: If variables are used without assignment.
+        """
+        ch_t: List[TSym] = [node.t for node in ast.ch]
+
+        if any(t.t is T.NA for t in ch_t):
+            node: AST = next(node for node in ast.ch if node.t.t is T.NA)
+
+            raise SemanticChkErr(node.tok.pos, self.__line, Errno.NOT_DEFINE, var=node.tok.v)
+
+        return ch_t
+
     def __chk_mem(self, ast: AST) -> NoReturn:
         """
         [ChkT] - [TMem]
@@ -118,21 +197,16 @@ class SemanticChk:
         [ChkVar] Type of a child should not be NA.
         [ChkLVal] Cannot be a l-value.
 
-        :raise SemanticErr[INVALID_LVAL]: If LHS of an assignment cannot be a l-value.
         :raise SemanticErr[NOT_DEFINE]: If variables are used without assignment.
         """
-        # [ChkLVal]
-        if ast.lval:
-            raise SemanticChkErr(-1, self.__line, Errno.INVALID_LVAL)
-
-        self.__chk_hlpr(ast.ch[0])
+        ch: AST = ast.ch[0]
 
         # [ChkVar]
-        if ast.ch[0].t.t == T.NA:
-            raise SemanticChkErr(ast.ch[0].tok.pos, self.__line, Errno.NOT_DEFINE, var=ast.ch[0].tok.v)
+        if ch.t.t is T.NA:
+            raise SemanticChkErr(ch.tok.pos, self.__line, Errno.NOT_DEFINE, var=ch.tok.v)
 
         # [ChkT] - [TMem]
-        ast.t = ast.ch[0].t
+        ast.t = ch.t
 
     def __chk_kwarg(self, ast: AST) -> NoReturn:
         """
@@ -142,21 +216,16 @@ class SemanticChk:
         [ChkVar] Type of a child should not be NA.
         [ChkLVal] Cannot be a l-value.
 
-        :raise SemanticErr[INVALID_LVAL]: If LHS of an assignment cannot be a l-value.
         :raise SemanticErr[NOT_DEFINE]: If variables are used without assignment.
         """
-        # [ChkLVal]
-        if ast.lval:
-            raise SemanticChkErr(-1, self.__line, Errno.INVALID_LVAL)
-
-        self.__chk_hlpr(ast.ch[0])
+        ch: AST = ast.ch[0]
 
         # [ChkVar]
-        if ast.ch[0].t.t == T.NA:
-            raise SemanticChkErr(ast.ch[0].tok.pos, self.__line, Errno.NOT_DEFINE, var=ast.ch[0].tok.v)
+        if ch.t.t is T.NA:
+            raise SemanticChkErr(ch.tok.pos, self.__line, Errno.NOT_DEFINE, var=ch.tok.v)
 
         # [ChkT] - [TKwarg]
-        ast.t = ast.ch[0].t
+        ast.t = ch.t
 
     def __chk_op(self, ast: AST) -> NoReturn:
         """
@@ -164,47 +233,31 @@ class SemanticChk:
         [ChkVar] Types of children should not be NA.
         [ChkLVal] Cannot be a l-value.
 
-        For exponentiation, checking should be done from the rightmost child because of its right to left associativity.
-        For other operators, check can be done from the leftmost child.
-        Although unary plus and minus has right to left associativity,
-        it has no need to take care of them since they has only one child.
-
         To outsource type inference, it calls t_chk function in Operator module.
         t_chk function returns both inferred type and function pointer(handle) which will be called for interpretation.
         It attaches these returns to ast.
+        Since the same operator tends to be applied to the same types repeatedly (e.g. 1 + 2 + 3 + 4),
+        results of t_chk are memoized during a single check.
 
-        :raise SemanticErr[INVALID_LVAL]: If LHS of an assignment cannot be a l-value.
         :raise SemanticErr[NOT_DEFINE]: If variables are used without assignment.
         :raise SemanticErr[SGNTR_NFOUND]: If there is a type error.
         """
-        # [ChkLVal]
-        if ast.lval:
-            raise SemanticChkErr(-1, self.__line, Errno.INVALID_LVAL)
-
-        if ast.tok.v == OpT.EXP:
-            self.__chk_hlpr(ast.ch[1])
-            self.__chk_hlpr(ast.ch[0])
-        else:
-            for node in ast.ch:
-                self.__chk_hlpr(node)
-
-        ch_t: List[TSym] = [node.t for node in ast.ch]
-
         # [ChkVar]
-        for i in range(len(ch_t)):
-            if ch_t[i].t == T.NA:
-                raise SemanticChkErr(ast.ch[i].tok.pos, self.__line, Errno.NOT_DEFINE, var=ast.ch[i].tok.v)
+        ch_t: List[TSym] = self.__ch_t(ast)
 
         # [ChkT]
-        if ast.tok.v <= OpT.DIV.value:
-            t, hndl = Arith.t_chk(ast.tok.v, ch_t)
-        elif ast.tok.v <= OpT.NEQ.value:
-            t, hndl = Comp.t_chk(ast.tok.v, ch_t)
-        else:
-            t, hndl = Logi.t_chk(ast.tok.v, ch_t)
+        key: Tuple[int, ...] = (ast.tok.v, *map(id, ch_t))
+        res: Optional[Tuple[Optional[TSym], Optional[Callable]]] = self.__t_chk_memo.get(key)
+
+        if res is None:
+            res = SemanticChk.__OP_T_CHK[ast.tok.v](ast.tok.v, ch_t)
+            self.__t_chk_memo[key] = res
+
+        t, hndl = res
 
         if t is None or hndl is None:
-            raise SemanticChkErr(ast.tok.pos, self.__line, Errno.SGNTR_NFOUND, infer=str(FunTSym(ch_t, TSym())))
+            raise SemanticChkErr(ast.tok.pos, self.__line, Errno.SGNTR_NFOUND,
+                                 infer=str(FunTSym(ch_t, SemanticChk.__NA_T)))
 
         ast.t = t
         ast.call = hndl
@@ -216,29 +269,27 @@ class SemanticChk:
         [ChkLVal] It can be l-value and in that case,
                   its first child which is the target of indexing operation should be l-value.
 
-        For function t_chk, refer to the comments of SemanticChk.__chk_op.
+        For function t_chk and its memoization, refer to the comments of SemanticChk.__chk_op.
 
         :raise SemanticErr[NOT_DEFINE]: If variables are used without assignment.
         :raise SemanticErr[SGNTR_NFOUND]: If there is a type error.
         """
-        # [ChkLVal]
-        ast.ch[0].lval = ast.lval
-
-        for node in ast.ch:
-            self.__chk_hlpr(node)
-
-        ch_t: List[TSym] = [node.t for node in ast.ch]
-
         # [ChkVar]
-        for i in range(len(ch_t)):
-            if ch_t[i].t == T.NA:
-                raise SemanticChkErr(ast.ch[i].tok.pos, self.__line, Errno.NOT_DEFINE, var=ast.ch[i].tok.v)
+        ch_t: List[TSym] = self.__ch_t(ast)
 
         # [ChkT]
-        t, hndl = Sp.t_chk(ast.tok.v, ch_t, ast.lval)
+        key: Tuple[int, ...] = (ast.tok.v, ast.lval, *map(id, ch_t))
+        res: Optional[Tuple[Optional[TSym], Optional[Callable]]] = self.__t_chk_memo.get(key)
+
+        if res is None:
+            res = Sp.t_chk(ast.tok.v, ch_t, ast.lval)
+            self.__t_chk_memo[key] = res
+
+        t, hndl = res
 
         if t is None or hndl is None:
-            raise SemanticChkErr(ast.tok.pos, self.__line, Errno.SGNTR_NFOUND, infer=str(FunTSym(ch_t, TSym())))
+            raise SemanticChkErr(ast.tok.pos, self.__line, Errno.SGNTR_NFOUND,
+                                 infer=str(FunTSym(ch_t, SemanticChk.__NA_T)))
 
         ast.t = t
         ast.call = hndl
@@ -261,42 +312,27 @@ class SemanticChk:
 
         For function t_chk, refer to the comments of SemanticChk.__chk_op.
 
-        :raise SemanticErr[INVALID_LVAL]: If LHS of an assignment cannot be a l-value.
         :raise SemanticErr[NOT_DEFINE]: If variables are used without assignment.
         :raise SemanticErr[ASGN_T_MISS]: If there is a type error.
         """
-        # [ChkLVal]
-        if ast.lval:
-            raise SemanticChkErr(-1, self.__line, Errno.INVALID_LVAL)
-
-        ast.ch[0].lval = True
-
-        try:
-            self.__chk_hlpr(ast.ch[0])
-            self.__chk_hlpr(ast.ch[1])
-        except SemanticChkErr as e:
-            if e.errno == Errno.INVALID_LVAL:
-                e.pos = ast.tok.pos
-
-            raise e
-
-        tar_t, val_t = ast.ch[0].t, ast.ch[1].t
+        tar, val = ast.ch
+        tar_t, val_t = tar.t, val.t
 
         # [ChkVar]
-        if val_t.t == T.NA:
-            raise SemanticChkErr(ast.tok.pos, self.__line, Errno.NOT_DEFINE, var=ast.ch[1].tok.v)
+        if val_t.t is T.NA:
+            raise SemanticChkErr(ast.tok.pos, self.__line, Errno.NOT_DEFINE, var=val.tok.v)
 
         # [ChkT]
-        if tar_t.t == T.NA or ast.ch[0].tok.t == TokT.VAR:
+        if tar_t.t is T.NA or tar.tok.t is TokT.VAR:
             # [TAsgn]
-            SymTab.inst().update_t(ast.ch[0].tok.v, val_t)
+            self.__sym_tab.update_t(tar.tok.v, val_t)
+            self.__var_t[tar.tok.v] = val_t
         else:
             # [TAsgnIdx]
-            t, _ = Sp.t_chk(ast.tok.v, [ast.ch[0].t, ast.ch[1].t])
+            t, _ = Sp.t_chk(ast.tok.v, [tar_t, val_t])
 
             if t is None:
-                raise SemanticChkErr(ast.tok.pos, self.__line, Errno.ASGN_T_MISS, tar_t=str(ast.ch[0].t),
-                                     val_t=str(ast.ch[1].t))
+                raise SemanticChkErr(ast.tok.pos, self.__line, Errno.ASGN_T_MISS, tar_t=str(tar_t), val_t=str(val_t))
 
         ast.t = val_t
 
@@ -313,26 +349,14 @@ class SemanticChk:
         [ChkVar] Types of children should not be NA.
         [ChkLVal] Cannot be a l-value.
 
-        :raise SemanticErr[INVALID_LVAL]: If LHS of an assignment cannot be a l-value.
         :raise SemanticErr[NOT_DEFINE]: If variables are used without assignment.
         :raise SemanticErr[INHOMO_ELEM]: If types of the elements of an array are not identical.
         """
-        # [ChkLVal]
-        if ast.lval:
-            raise SemanticChkErr(-1, self.__line, Errno.INVALID_LVAL)
-
-        for node in ast.ch:
-            self.__chk_hlpr(node)
-
-        ch_t: List[TSym] = [node.t for node in ast.ch]
-
         # [ChkVar]
-        for i in range(len(ch_t)):
-            if ch_t[i].t == T.NA:
-                raise SemanticChkErr(ast.ch[i].tok.pos, self.__line, Errno.NOT_DEFINE, var=ast.ch[i].tok.v)
+        ch_t: List[TSym] = self.__ch_t(ast)
 
         # [ChkT] - [TSnglArr] & [TDblArr]
-        elem_t: Optional[TSym] = TSym.sup(*ch_t)
+        elem_t: Optional[TSym] = TSym.sup_iter(ch_t)
 
         if elem_t is None:
             raise SemanticChkErr(ast.tok.pos, self.__line, Errno.INHOMO_ELEM, infer=', '.join(map(str, ch_t)))
@@ -349,113 +373,153 @@ class SemanticChk:
         [ChkLVal] Cannot be a l-value.
         [ChkDup] Duplicated member ids are not allowed.
 
-        :raise SemanticErr[INVALID_LVAL]: If LHS of an assignment cannot be a l-value.
         :raise SemanticErr[NOT_DEFINE]: If variables are used without assignment.
         :raise SemanticErr[ID_DUP]: If some member ids are duplicated.
-        """
-        # [ChkLVal]
-        if ast.lval:
-            raise SemanticChkErr(-1, self.__line, Errno.INVALID_LVAL)
-
-        for node in ast.ch:
-            self.__chk_hlpr(node)
-
-        id_: List[str] = [node.tok.v for node in ast.ch]
-        ch_t: List[TSym] = [node.t for node in ast.ch]
-
-        # [ChkVar]
-        for i in range(len(ch_t)):
-            if ch_t[i].t == T.NA:
-                raise SemanticChkErr(ast.ch[i].tok.pos, self.__line, Errno.NOT_DEFINE, var=ast.ch[i].tok.v)
 
+        [ChkVar], [ChkDup], and [ChkT] are done in a single pass over the members.
+        Since [ChkVar] precedes [ChkDup], duplicated ids are reported after all members are checked.
+        """
         elem_t: Dict[str, TSym] = {}
+        # First member whose id is duplicated.
+        dup: Optional[AST] = None
 
-        # [ChkT] - [TStrt], [ChkDup]
-        for i in range(len(id_)):
-            if id_[i] in elem_t:
-                raise SemanticChkErr(ast.ch[i].tok.pos, self.__line, Errno.ID_DUP, id_=id_[i])
+        for node in ast.ch:
+            # [ChkVar]
+            if node.t.t is T.NA:
+                raise SemanticChkErr(node.tok.pos, self.__line, Errno.NOT_DEFINE, var=node.tok.v)
+
+            # [ChkT] - [TStrt], [ChkDup]
+            if node.tok.v in elem_t:
+                if dup is None:
+                    dup = node
+            else:
+                elem_t[node.tok.v] = node.t
 
-            elem_t[id_[i]] = ch_t[i]
+        # [ChkDup]
+        if dup is not None:
+            raise SemanticChkErr(dup.tok.pos, self.__line, Errno.ID_DUP, id_=dup.tok.v)
 
-        t: TSym = StrtTSym(elem_t)
-        ast.t = t
+        ast.t = StrtTSym(elem_t)
 
-    def __chk_fun(self, ast: AST) -> NoReturn:
+    def __fill_kwarg(self, ast: AST) -> NoReturn:
         """
-        [ChkT] - [TFun]
-            If   env(i - 1) |- ei => envi, ai for all i
-                 envp[f] = (bi, ..., bp) => c
-                 ai <: bi for all i
-            Then env0 |- f(e1, ..., ep) => envp, c
-        [ChkVar] Types of children should not be NA.
-        [ChkLVal] Cannot be a l-value.
+        Replaces keyword arguments of a function call with positional ones.
 
-        
+        Keyword arguments which are not given are filled with their default values.
+        Given keyword arguments are collected into a dictionary first,
+        so that each formal keyword argument is matched in constant time.
+        Default values are parsed only once and cached in the function.
+        Each call site gets a fresh clone of the cached AST, since checker and interpreter write into nodes.
+        (eg. Interpreter replaces token values of operator nodes with their results.)
+        This must be done before its children are checked, since it rewrites the children of ast.
 
-        :raise SemanticErr[INVALID_LVAL]: If LHS of an assignment cannot be a l-value.
-        :raise SemanticErr[NOT_DEFINE]: If variables are used without assignment.
-        :raise SemanticErr[SGNTR_NFOUND]: If there is a type error.
+        :param ast: AST with function token.
         """
-        # [ChkLVal]
-        if ast.lval:
-            raise SemanticChkErr(-1, self.__line, Errno.INVALID_LVAL)
-
         kwargs: List[Tuple[str, Any]] = ast.tok.v.kwargs
         ch: List[AST] = []
 
         i: int = 0
 
-        while i < len(ast.ch) and ast.ch[i].tok.t != TokT.KWARG:
+        while i < len(ast.ch) and ast.ch[i].tok.t is not TokT.KWARG:
             ch.append(ast.ch[i])
             i += 1
 
-        for k, v in kwargs[max(i - ast.tok.v.nargs, 0):]:
-            j: int = 0
+        # Given keyword arguments. If a keyword is given more than once, the first one is used.
+        given: Dict[str, AST] = {}
 
-            while j < len(ast.ch) - i:
-                if ast.ch[i + j].tok.v == k:
-                    ch.append(ast.ch[i + j].ch[0])
+        for node in ast.ch[i:]:
+            given.setdefault(node.tok.v, node.ch[0])
 
-                    break
+        # Parsed default values.
+        dflt: Dict[str, AST] = ast.tok.v.dflt
 
-                j += 1
+        for k, v in kwargs[max(i - ast.tok.v.nargs, 0):]:
+            if k in given:
+                ch.append(given[k])
+            else:
+                if k not in dflt:
+                    dflt[k] = Parser.inst().parse(v)
 
-            if j == len(ast.ch) - i:
-                ch.append(Parser.inst().parse(v))
+                ch.append(dflt[k].clone())
 
         ast.ch = ch
 
-        for node in ast.ch:
-            self.__chk_hlpr(node)
+    def __chk_fun(self, ast: AST) -> NoReturn:
+        """
+        [ChkT] - [TFun]
+            If   env(i - 1) |- ei => envi, ai for all i
+                 envp[f] = (bi, ..., bp) => c
+                 ai <: bi for all i
+            Then env0 |- f(e1, ..., ep) => envp, c
+        [ChkVar] Types of children should not be NA.
+        [ChkLVal] Cannot be a l-value.
 
-        ch_t: List[TSym] = [node.t for node in ast.ch]
+        Keyword arguments are already replaced by SemanticChk.__fill_kwarg.
+        Since the same function tends to be called with the same argument types,
+        results of signature checks are cached by the ids of the types.
+        Function type of the call is constructed only for the error message.
 
+        :raise SemanticErr[NOT_DEFINE]: If variables are used without assignment.
+        :raise SemanticErr[SGNTR_NFOUND]: If there is a type error.
+        """
         # [ChkVar]
-        for i in range(len(ch_t)):
-            if ch_t[i].t == T.NA:
-                raise SemanticChkErr(ast.ch[i].tok.pos, self.__line, Errno.NOT_DEFINE, var=ast.ch[i].tok.v)
+        ch_t: List[TSym] = self.__ch_t(ast)
 
         # [ChkT] - [TFun]
-        if not (FunTSym(ch_t, ast.tok.v.t.ret) <= ast.tok.v.t):
-            raise SemanticChkErr(ast.tok.pos, self.__line, Errno.SGNTR_NFOUND, infer=str(FunTSym(ch_t, TSym())))
+        key: Tuple[int, ...] = (id(ast.tok.v.t), *map(id, ch_t))
+        hit: Optional[Tuple[TSym, List[TSym], bool]] = self.__sgntr_cache.get(key)
+
+        if hit is None:
+            if len(self.__sgntr_cache) >= SemanticChk.__SGNTR_CACHE_SZ:
+                self.__sgntr_cache.clear()
+
+            # [SubFun] with the same return type reduces to the check of argument types.
+            # Thus it is done directly, without constructing function type of the call.
+            args: Tuple[TSym, ...] = ast.tok.v.t.args
+            hit = (ast.tok.v.t, ch_t, len(ch_t) == len(args) and all(map(TSym.__le__, ch_t, args)))
+            self.__sgntr_cache[key] = hit
+
+        if not hit[2]:
+            raise SemanticChkErr(ast.tok.pos, self.__line, Errno.SGNTR_NFOUND,
+                                 infer=str(FunTSym(ch_t, SemanticChk.__NA_T)))
 
         ast.t = ast.tok.v.t.ret
         ast.call = ast.tok.v.call
 
-    def __chk_hlpr(self, ast: AST) -> NoReturn:
+    def __chk_num(self, ast: AST) -> NoReturn:
         """
-        Routes semantic checking logic according to the type of currently visiting node ast.
-
-        Checking logic for terminal nodes are implemented here since they are quite simple.
-
         [ChkT] - [TNum]
             env |- n => env, Num
+        [ChkVar] Terminal nodes have no children.
+        """
+        ast.t = NUM_T
+
+    def __chk_bool(self, ast: AST) -> NoReturn:
+        """
         [ChkT] - [TBool]
             env |- b => env, Bool
+        [ChkVar] Terminal nodes have no children.
+        """
+        ast.t = BOOL_T
+
+    def __chk_str(self, ast: AST) -> NoReturn:
+        """
         [ChkT] - [TStr]
             env |- s => env, Str
+        [ChkVar] Terminal nodes have no children.
+        """
+        ast.t = STR_T
+
+    def __chk_void(self, ast: AST) -> NoReturn:
+        """
         [ChkT] - [TVoid]
             env |- v => env, Void
+        [ChkVar] Terminal nodes have no children.
+        """
+        ast.t = VOID_T
+
+    def __chk_var(self, ast: AST) -> NoReturn:
+        """
         [ChkT] - [TVarFound]
             If   env[x] = a
             Then env |- x => a
@@ -463,67 +527,112 @@ class SemanticChk:
             If   x not in env
             Then env |- x => NA
         [ChkVar] Terminal nodes have no children.
-        [ChkLVal] Only Var can be l-value. Other terminal nodes cannot be l-values.
+
+        Looked up types are kept until the end of the current check,
+        since the same variable tends to appear many times in a single expression.
+        """
+        var_t: Optional[TSym] = self.__var_t.get(ast.tok.v)
+
+        if var_t is None:
+            var_t = self.__sym_tab.lookup_t(ast.tok.v)
+
+            if var_t is not None:
+                self.__var_t[ast.tok.v] = var_t
+
+        ast.t = SemanticChk.__NA_T if var_t is None else var_t
+
+    def __chk_hlpr(self, ast: AST) -> NoReturn:
+        """
+        Traverses AST in postorder and applies checking logic to each node.
+
+        The traversal is done iteratively with an explicit stack, rather than recursively,
+        to avoid the overhead of Python function calls.
+        Each node is visited twice.
+        At the first visit, top-down logic is applied and its children are pushed.
+        At the second visit, all its children are checked and the checking logic for the node is applied.
+        Checking logic for each node is looked up once when the node is constructed (refer to AST class),
+        so routing is just a single call to it.
+
+        Top-down logic are as follows:
+            1. [ChkLVal] Only Var and indexing can be l-values. Other nodes cannot be l-values.
+            2. [ChkLVal] LHS of an assignment should be l-value.
+            3. [ChkLVal] Target of indexing should be l-value if the indexing is l-value.
+            4. Keyword arguments of a function call are replaced by positional ones.
+               (Refer to SemanticChk.__fill_kwarg.)
+        For exponentiation, checking should be done from the rightmost child because of its right to left associativity.
+        For other operators, check can be done from the leftmost child.
+        Although unary plus and minus has right to left associativity,
+        it has no need to take care of them since they has only one child.
+
+        Invalid l-value is reported at the position of the outermost assignment enclosing it.
+        Thus the position is carried along with each node in the stack.
 
         :param ast: AST to be checked.
 
         :raise SemanticErr[INVALID_LVAL]: If LHS of an assignment cannot be a l-value.
         """
-        if ast.tok.t == TokT.NUM:
-            # [ChkLVal]
-            if ast.lval:
-                raise SemanticChkErr(-1, self.__line, Errno.INVALID_LVAL)
+        # Stack of nodes to be visited.
+        # Each entry consists of a node, a flag indicating whether its children are checked or not,
+        # and the position of the outermost assignment enclosing the node. (-1 if there is no such one.)
+        stk: List[Tuple[AST, bool, int]] = [(ast, False, -1)]
 
-            # [ChkT] - [TNum]
-            ast.t = NumTSym()
-        elif ast.tok.t == TokT.BOOL:
-            # [ChkLVal]
-            if ast.lval:
-                raise SemanticChkErr(-1, self.__line, Errno.INVALID_LVAL)
+        # Frequently used names are bound to local variables, which are faster to access than attributes.
+        push: Callable = stk.append
+        pop: Callable = stk.pop
+        extend: Callable = stk.extend
+        fill_kwarg: Callable = self.__fill_kwarg
+        var, op, fun = TokT.VAR, TokT.OP, TokT.FUN
+        idx, asgn, exp = OpT.IDX, OpT.ASGN, OpT.EXP
 
-            # [ChkT] - [TBool]
-            ast.t = BoolTSym()
-        elif ast.tok.t == TokT.STR:
-            # [ChkLVal]
-            if ast.lval:
-                raise SemanticChkErr(-1, self.__line, Errno.INVALID_LVAL)
+        while stk:
+            node, visited, asgn_pos = pop()
+
+            if visited:
+                node.chk(self, node)
+
+                continue
+
+            tok: Tok = node.tok
+            tok_t: TokT = tok.t
+            lval: bool = node.lval
 
-            # [ChkT] - [TStr]
-            ast.t = StrTSym()
-        elif ast.tok.t == TokT.VOID:
             # [ChkLVal]
-            if ast.lval:
-                raise SemanticChkErr(-1, self.__line, Errno.INVALID_LVAL)
-
-            # [ChkT] - [TVoid]
-            ast.t = VoidTSym()
-        elif ast.tok.t == TokT.VAR:
-            # [ChkT] - [TVarFound] & [TVarNFound]
-            var_t = SymTab.inst().lookup_t(ast.tok.v)
-            ast.t = TSym() if var_t is None else var_t
-        elif ast.tok.t == TokT.KWARG:
-            self.__chk_kwarg(ast)
-        elif ast.tok.t == TokT.MEM:
-            self.__chk_mem(ast)
-        elif ast.tok.t == TokT.OP:
-            if ast.tok.v == OpT.IDX:
-                self.__chk_idx(ast)
-            elif ast.tok.v == OpT.ASGN:
-                self.__chk_asgn(ast)
+            if lval and tok_t is not var and (tok_t is not op or tok.v is not idx):
+                raise SemanticChkErr(asgn_pos, self.__line, Errno.INVALID_LVAL)
+
+            ch: List[AST] = node.ch
+
+            if tok_t is fun:
+                fill_kwarg(node)
+                ch = node.ch
+            elif tok_t is op:
+                if tok.v is idx:
+                    # [ChkLVal]
+                    ch[0].lval = lval
+                elif tok.v is asgn:
+                    # [ChkLVal]
+                    ch[0].lval = True
+
+                    if asgn_pos < 0:
+                        asgn_pos = tok.pos
+
+            if not ch:
+                node.chk(self, node)
+
+                continue
+
+            push((node, True, asgn_pos))
+
+            if tok_t is op and tok.v is exp:
+                extend((c, False, asgn_pos) for c in ch)
             else:
-                self.__chk_op(ast)
-        elif ast.tok.t == TokT.ARR:
-            self.__chk_arr(ast)
-        elif ast.tok.t == TokT.STRT:
-            self.__chk_strt(ast)
-        else:
-            self.__chk_fun(ast)
+                extend((c, False, asgn_pos) for c in reversed(ch))
 
     def chk(self, ast: AST, line: str) -> AST:
         """
         Checks semantics.
 
-        Traverses AST in postorder and recursively applies checking logic described above.
+        Traverses AST in postorder and applies checking logic described above.
         If the check runs without any exception, it is ensured that there will be no semantic errors.
         During the check, type field of each node will be filled with the inferred type.
         (For nodes corresponding to operator or function token, call field will also be filled.)
@@ -538,36 +647,14 @@ class SemanticChk:
         """
         self.__ast = ast
         self.__line = line
+        self.__sym_tab = SymTab.inst()
+        self.__var_t = {}
+        self.__t_chk_memo = {}
 
         self.__chk_hlpr(ast)
 
         # Final [ChkVar] for the root node is needed to prevent the marginal case like 'x' where x is not assigned.
-        if ast.t.t == T.NA:
+        if ast.t.t is T.NA:
             raise SemanticChkErr(ast.tok.pos, self.__line, Errno.NOT_DEFINE, var=ast.tok.v)
 
         return ast
-
-    """
-    DEBUGGING
-    """
-
-    def test(self, ast: AST, line: str) -> NoReturn:
-        start: float = timer()
-        rt: AST = self.chk(ast, line)
-        end: float = timer()
-
-        print('------ TEST SUMMARY ------')
-        print(f'  @module : PARSER')
-        print(f'  @elapsed: {round((end - start) * 1e4, 4)}ms')
-        print(f'  @sample : {line}')
-        print('--------- RESULT ---------')
-        print('* Postorder traversal')
-        self.__test_hlpr(rt, 0)
-
-    def __test_hlpr(self, ast: AST, cnt: int) -> int:
-        for node in ast.ch:
-            cnt = self.__test_hlpr(node, cnt)
-
-        print(f'[{cnt}] {ast}')
-
-        return cnt + 1
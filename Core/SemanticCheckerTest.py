@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from timeit import default_timer as timer
+from .AST import *
+
+
+class SemanticChkTest:
+    """
+    Debugging routines for semantic checker.
+
+    This class is mixed into SemanticChk only when __debug__ is set, i.e. not in optimized mode(python -O).
+    Thus it is not loaded at all in production.
+    """
+    __slots__ = ()
+
+    """
+    DEBUGGING
+    """
+
+    def test(self, ast: AST, line: str) -> NoReturn:
+        start: float = timer()
+        rt: AST = self.chk(ast, line)
+        end: float = timer()
+
+        print('------ TEST SUMMARY ------')
+        print(f'  @module : PARSER')
+        print(f'  @elapsed: {round((end - start) * 1e4, 4)}ms')
+        print(f'  @sample : {line}')
+        print('--------- RESULT ---------')
+        print('* Postorder traversal')
+        self.__test_hlpr(rt, 0)
+
+    def __test_hlpr(self, ast: AST, cnt: int) -> int:
+        for node in ast.ch:
+            cnt = self.__test_hlpr(node, cnt)
+
+        print(f'[{cnt}] {ast}')
+
+        return cnt + 1
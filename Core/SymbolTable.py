@@ -1,9 +1,28 @@
 from __future__ import annotations
 
+import sys
 from .TypeSymbol import *
 from .Type import *
 
 
+@final
+class SymEnt:
+    """
+    Entry of the merged type table and symbol table.
+
+    Fields are accessed directly, without getters and setters, since they are on the hot path of every lookup.
+    This class is for internal use of SymTab only.
+    This class is the end of inheritance. No further inheritance is allowed.
+    """
+    __slots__ = ('t', 'v')
+
+    def __init__(self) -> None:
+        # Type of the variable.
+        self.t: Optional[TSym] = None
+        # Value of the variable.
+        self.v: Any = None
+
+
 @final
 class SymTab:
     """
@@ -26,12 +45,18 @@ class SymTab:
     It uses the id of variable as a key and has one entry, the value of the variable.
     Since this language does not support scoping (all variables are in global scope)
     there is no need to store additional information in type table and symbol table.
+    Since both of them are keyed by the id of variable, they are merged into a single table
+    whose entries hold both the type and the value. (Refer to SymEnt class.)
 
     This class is implemented as a singleton. The singleton object will be instantiated at its first call.
     This class is the end of inheritance. No further inheritance is allowed.
     """
     # Singleton object.
     __inst: ClassVar[SymTab] = None
+    # Hard coded keywords. Keyword table is initialized with a copy of it.
+    __KWORD: Final[ClassVar[Dict[str, Tuple[TokT, Any]]]] = {
+        'T': (TokT.BOOL, True), 'F': (TokT.BOOL, False), 'TRUE': (TokT.BOOL, True), 'FALSE': (TokT.BOOL, False)
+    }
 
     @classmethod
     def inst(cls, *args, **kwargs) -> SymTab:
@@ -42,13 +67,13 @@ class SymTab:
 
     def __init__(self) -> None:
         # Keyword table.
-        self.__kword: Dict[str, Tuple[TokT, Any]] = {
-            'T': (TokT.BOOL, True), 'F': (TokT.BOOL, False), 'TRUE': (TokT.BOOL, True), 'FALSE': (TokT.BOOL, False)
-        }
-        # Type table.
-        self.__t: Dict[str, TSym] = {}
-        # Symbol table.
-        self.__v: Dict[str, Any] = {}
+        self.__kword: Dict[str, Tuple[TokT, Any]] = dict(SymTab.__KWORD)
+        # Lookup for keyword table. It is called by lexer for every id.
+        # Since keyword table is never replaced, it is bound directly to the lookup of the underlying dictionary
+        # rather than defined as a method, which saves a Python level call for every id.
+        self.lookup_kw: Callable[[str], Optional[Tuple[TokT, Any]]] = self.__kword.get
+        # Type table and symbol table.
+        self.__var: Dict[str, SymEnt] = {}
 
     """
     LOOKUP & UPDATE
@@ -58,25 +83,50 @@ class SymTab:
     
     Update function takes key and entry information and stores it.
     If entries with the passed key already exist in the table, then they will be overwritten.
+    Keys are interned when they are stored, so that lookups with ids from lexer, which are also interned,
+    can be resolved by pointer comparison.
     """
 
-    def lookup_kw(self, k: str) -> Optional[Tuple[TokT, Any]]:
-        return self.__kword.get(k, None)
-
     def lookup_t(self, k: str) -> Optional[TSym]:
-        return self.__t.get(k, None)
+        ent: Optional[SymEnt] = self.__var.get(k, None)
+
+        return None if ent is None else ent.t
 
     def lookup_v(self, k: str) -> Any:
-        return self.__v.get(k, None)
+        ent: Optional[SymEnt] = self.__var.get(k, None)
+
+        return None if ent is None else ent.v
 
     def update_kw(self, k: str, v: Any, t: TokT = TokT.FUN) -> NoReturn:
-        self.__kword[k] = (t, v)
+        self.__kword[sys.intern(k)] = (t, v)
+
+    def update_kw_bulk(self, kv: Iterable[Tuple[str, Any]], t: TokT = TokT.FUN) -> NoReturn:
+        """
+        Stores multiple keywords of the same token type at once.
+
+        It is used by initializer to register built-ins of a module in a single update of keyword table,
+        rather than calling SymTab.update_kw for each of them.
+
+        :param kv: Pairs of keywords and their values.
+        :param t: Token type of the keywords.
+        """
+        self.__kword.update((sys.intern(k), (t, v)) for k, v in kv)
 
     def update_t(self, k: str, t: TSym) -> NoReturn:
-        self.__t[k] = t
+        ent: Optional[SymEnt] = self.__var.get(k, None)
+
+        if ent is None:
+            ent = self.__var[sys.intern(k)] = SymEnt()
+
+        ent.t = t
 
     def update_v(self, k: str, v: Any) -> NoReturn:
-        self.__v[k] = v
+        ent: Optional[SymEnt] = self.__var.get(k, None)
+
+        if ent is None:
+            ent = self.__var[sys.intern(k)] = SymEnt()
+
+        ent.v = v
 
 
 """
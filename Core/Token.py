@@ -10,54 +10,66 @@ class Tok:
 
     This class is the end of inheritance. No further inheritance is allowed.
     """
+    __slots__ = ('_t', '_v', '_pos')
 
     def __init__(self, t: TokT, v: Any = None, pos: int = -1) -> None:
         # Token type.
-        self.__t: TokT = t
+        self._t: TokT = t
         # Token value.
         # For array token and struct token, this field will be assigned by interpreter.
         # For void token and EOF token, this field will never be assigned.
         # For other tokens, this field will be assigned at the time of instantiation by lexer.
-        self.__v: Any = v
+        self._v: Any = v
         # Position in the raw input string where the token is derived.
-        self.__pos: int = pos
+        self._pos: int = pos
 
     """
     BUILT-IN OVERRIDING
     """
 
     def __str__(self) -> str:
-        return f'Token\n  @type : {self.__t.name}\n  @value: {str(self.__v)}\n  @pos  : {self.__pos}'
+        return f'<Tok {self._t.name}@{self._pos}>'
 
     __repr__ = __str__
 
+    """
+    DEBUGGING
+    """
+
+    def describe(self) -> str:
+        """
+        Describes the token in detail.
+
+        Unlike string representation of the token, which is kept short since it may be formatted frequently,
+        it also formats the value of the token. Use it for debugging dumps.
+
+        :return: Detailed description of the token.
+        """
+        return f'Token\n  @type : {self._t.name}\n  @value: {str(self._v)}\n  @pos  : {self._pos}'
+
     """
     GETTER & SETTER
     """
 
     @property
     def t(self) -> TokT:
-        return self.__t
+        return self._t
 
     @property
     def v(self) -> Any:
-        return self.__v
+        return self._v
 
     @property
     def pos(self) -> int:
-        return self.__pos
-
-    @t.setter
-    def t(self, t: TokT) -> NoReturn:
-        self.__t: TokT = t
+        return self._pos
 
     @v.setter
     def v(self, v: Any) -> NoReturn:
-        self.__v: Any = v
+        self._v: Any = v
 
     @pos.setter
     def pos(self, pos: int) -> NoReturn:
-        self.__pos = pos
+        self._pos = pos
 
 
 """
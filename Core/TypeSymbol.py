@@ -25,12 +25,31 @@ class TSym:
     Nevertheless, there are some special occasions where direct instantiation of this class is quite useful.
     In such occasions, extra care must be taken since the instance has NA type, unless specified.
     """
+    __slots__ = ('_t', '_base', '_hash')
+
+    # Cache for supremum of two types. (Refer to TSym.sup.)
+    # Keys are ids of two types and values are the two types with their supremum.
+    # Types themselves are also stored to keep them alive, so that their ids are not reused by other objects.
+    __sup_cache: ClassVar[Dict[Tuple[int, int], Tuple[TSym, TSym, Optional[TSym]]]] = {}
+    # Maximum # of entries of the cache. If it is exceeded, the cache is flushed.
+    __SUP_CACHE_SZ: Final[ClassVar[int]] = 4096
+    # Caches for equality and subtype relation of two composite types. (Refer to TSym.__eq__ and TSym.__le__.)
+    # Like the cache for supremum, keys are ids of two types and values are the two types with the result.
+    __eq_cache: ClassVar[Dict[Tuple[int, int], Tuple[TSym, TSym, bool]]] = {}
+    __le_cache: ClassVar[Dict[Tuple[int, int], Tuple[TSym, TSym, bool]]] = {}
+    # Maximum # of entries of the caches. If it is exceeded, the cache is flushed.
+    __CMP_CACHE_SZ: Final[ClassVar[int]] = 4096
+    # Set of base types.
+    __BASE_T: Final[ClassVar[FrozenSet[T]]] = frozenset([T.NUM, T.BOOL, T.STR, T.VOID])
 
     def __init__(self, t: T = T.NA) -> None:
         # Symbol type. Subclasses fill in this field automatically with proper value.
-        self.__t: T = t
+        self._t: T = t
         # Flag indicating whether the type is base type or not.
-        self.__base: bool = t in [T.NUM, T.BOOL, T.STR, T.VOID]
+        self._base: bool = t in TSym.__BASE_T
+        # Structural hash, consistent with equality. Composite types override it with the one built from their
+        # components, so that hashing never walks through the whole type.
+        self._hash: int = hash(t)
 
     """
     BUILT-IN OVERRIDING
@@ -41,6 +60,9 @@ class TSym:
 
     __repr__ = __str__
 
+    def __hash__(self) -> int:
+        return self._hash
+
     """
     OPERATIONS
     """
@@ -62,23 +84,90 @@ class TSym:
 
         :return: True if self == other. False otherwise.
         """
-        if self.__t != other.__t:
+        if self is other:
+            return True
+
+        if self._t is not other._t:
             return False
 
-        if self.__base and other.__base and self.__t == other.__t:
+        if self._base:
             # [EqBase]
             return True
-        elif self.__t == T.ARR:
-            # [EqArr]
-            return self.elem.__t == other.elem.__t and self.dept == other.dept
-        elif self.__t == T.STRT:
-            # [EqStrt]
-            return self.elem == other.elem
-        elif self.__t == T.FUN:
-            # [EqFun]
-            return self.args == other.args and self.ret == other.ret
-
-        return False
+
+        # Equality of composite types requires deep comparison. Thus the result is cached by ids of types.
+        key: Tuple[int, int] = (id(self), id(other))
+        hit: Optional[Tuple[TSym, TSym, bool]] = TSym.__eq_cache.get(key)
+
+        if hit is not None:
+            return hit[2]
+
+        res: bool = TSym.__eq_walk(self, other)
+
+        if len(TSym.__eq_cache) >= TSym.__CMP_CACHE_SZ:
+            TSym.__eq_cache.clear()
+
+        TSym.__eq_cache[key] = (self, other, res)
+
+        return res
+
+    @staticmethod
+    def __eq_walk(a: TSym, b: TSym) -> bool:
+        """
+        Determines whether two types are equal or not, without recursion.
+
+        Pairs of types to be compared are kept in a stack.
+        Logic for each composite type checks the pair itself and returns pairs of components to be compared further,
+        or None if the pair violates the rule. Then the components are pushed onto the stack.
+        Thus comparison of nested types needs no nested Python calls, and only the result of the entry pair is cached.
+
+        :param a: Type to be tested.
+        :param b: Type to be tested.
+
+        :return: True if a == b. False otherwise.
+        """
+        stack: List[Tuple[TSym, TSym]] = [(a, b)]
+
+        while stack:
+            a, b = stack.pop()
+
+            if a is b:
+                continue
+            elif a._t is not b._t:
+                return False
+            elif a._base:
+                # [EqBase]
+                continue
+
+            hndl: Optional[Callable] = TSym.__EQ_HNDL[a._t]
+            ch: Optional[Iterable[Tuple[TSym, TSym]]] = None if hndl is None else hndl(a, b)
+
+            if ch is None:
+                return False
+
+            stack.extend(ch)
+
+        return True
+
+    def __eq_arr(self, other: ArrTSym) -> Optional[Iterable[Tuple[TSym, TSym]]]:
+        # [EqArr]
+        return () if self._elem._t is other._elem._t and self._dept == other._dept else None
+
+    def __eq_strt(self, other: StrtTSym) -> Optional[Iterable[Tuple[TSym, TSym]]]:
+        # [EqStrt]
+        if self._elem.keys() != other._elem.keys():
+            return None
+
+        return [(t, other._elem[k]) for k, t in self._elem.items()]
+
+    def __eq_fun(self, other: FunTSym) -> Optional[Iterable[Tuple[TSym, TSym]]]:
+        # [EqFun]
+        # Cheap checks come first. Equal function types have the same signature hash, and return types are compared
+        # before argument types since return type is a single type, which is usually a base type.
+        # (The last pair pushed onto the stack is compared first.)
+        if self._sgntr != other._sgntr or len(self._args) != len(other._args):
+            return None
+
+        return [*zip(self._args, other._args), (self._ret, other._ret)]
 
     def __le__(self, other: TSym) -> bool:
         """
@@ -100,45 +189,118 @@ class TSym:
 
         :return: True if self <: other. False otherwise.
         """
-        if self.__t == T.VOID:
+        if self is other:
+            # [SubEq]
+            return True
+
+        if self._t is T.VOID:
             # [SubVoid]
             return True
-        elif self.__t == T.BOOL and other.__t == T.NUM:
+        elif self._t is T.BOOL and other._t is T.NUM:
             # [SubBoolNum]
             return True
-        elif self.__base and other.__base and self == other:
+        elif self._base and other._base:
             # [SubEq]
-            return True
+            return self == other
+        elif self._t is not other._t and other._t is not T.ARR:
+            # Except [SubBaseArr] and [SubArr], no rule relates types of different symbol types.
+            # Thus they are rejected without walking through them.
+            return False
 
-        if other.__t == T.ARR:
-            if self.__base:
-                # [SubBaseArr]
-                return self <= other.elem
-            elif self.__t == T.ARR:
-                # [SubArr]
-                return self.elem <= other.elem and self.dept <= other.dept
-
-        if self.__t == other.__t == T.STRT:
-            # [SubStrt]
-            if len(self.elem) != len(other.elem):
-                return False
+        # Subtype relation involving composite types requires deep walk. Thus the result is cached by ids of types.
+        key: Tuple[int, int] = (id(self), id(other))
+        hit: Optional[Tuple[TSym, TSym, bool]] = TSym.__le_cache.get(key)
+
+        if hit is not None:
+            return hit[2]
+
+        res: bool = TSym.__le_walk(self, other)
+
+        if len(TSym.__le_cache) >= TSym.__CMP_CACHE_SZ:
+            TSym.__le_cache.clear()
 
-            for k, t1 in self.elem.items():
-                t2: Optional[TSym] = other.elem.get(k, None)
+        TSym.__le_cache[key] = (self, other, res)
+
+        return res
+
+    @staticmethod
+    def __le_walk(a: TSym, b: TSym) -> bool:
+        """
+        Determines whether type a is a subtype of type b or not, without recursion.
 
-                if t2 is None or not (t1 <= t2):
+        Like TSym.__eq_walk, pairs of types to be tested are kept in a stack,
+        and logic for each composite type returns pairs of components to be tested further, or None.
+
+        :param a: Type to be tested.
+        :param b: Type to be tested.
+
+        :return: True if a <: b. False otherwise.
+        """
+        stack: List[Tuple[TSym, TSym]] = [(a, b)]
+
+        while stack:
+            a, b = stack.pop()
+
+            if a is b or a._t is T.VOID or (a._t is T.BOOL and b._t is T.NUM):
+                # [SubEq], [SubVoid], and [SubBoolNum]
+                continue
+            elif a._base and b._base:
+                # [SubEq]
+                if a._t is not b._t:
                     return False
 
-            return True
+                continue
+            elif a._t is not b._t and b._t is not T.ARR:
+                return False
+
+            hndl: Optional[Callable] = TSym.__LE_HNDL[b._t]
+            ch: Optional[Iterable[Tuple[TSym, TSym]]] = None if hndl is None else hndl(a, b)
 
-        if self.__t == other.__t == T.FUN:
-            # [SubFun]
-            if len(self.args) != len(other.args):
+            if ch is None:
                 return False
 
-            return all([self.args[i] <= other.args[i] for i in range(len(self.args))]) and self.ret <= other.ret
+            stack.extend(ch)
 
-        return False
+        return True
+
+    def __le_arr(self, other: ArrTSym) -> Optional[Iterable[Tuple[TSym, TSym]]]:
+        if self._base:
+            # [SubBaseArr]
+            return (self, other._elem),
+        elif self._t is T.ARR and self._dept <= other._dept:
+            # [SubArr]
+            return (self._elem, other._elem),
+
+        return None
+
+    def __le_strt(self, other: StrtTSym) -> Optional[Iterable[Tuple[TSym, TSym]]]:
+        # [SubStrt]
+        # Members sorted by their ids are compared pairwise, which needs no lookup for the ids.
+        # Pairs of base types are returned last, so that they are popped and tested before the others.
+        # Then mismatches in cheap members are found before walking through composite members.
+        if len(self._items) != len(other._items):
+            return None
+
+        ch: List[Tuple[TSym, TSym]] = []
+        base: List[Tuple[TSym, TSym]] = []
+
+        for (k1, t1), (k2, t2) in zip(self._items, other._items):
+            if k1 != k2:
+                return None
+
+            (base if t1._base and t2._base else ch).append((t1, t2))
+
+        ch.extend(base)
+
+        return ch
+
+    def __le_fun(self, other: FunTSym) -> Optional[Iterable[Tuple[TSym, TSym]]]:
+        # [SubFun]
+        # Like [EqFun], return types are compared before argument types.
+        if len(self._args) != len(other._args):
+            return None
+
+        return [*zip(self._args, other._args), (self._ret, other._ret)]
 
     @staticmethod
     def sup(*set_: TSym) -> Optional[TSym]:
@@ -151,6 +313,10 @@ class TSym:
         Since subtype system is not a preorder, supremum of some sets may not exist.
         Also, supremum of an empty set is defined as Void.
 
+        Since supremum of the same pair of types is computed repeatedly during semantic checking,
+        supremum of two types is cached by their ids. (Type symbols are never modified once constructed.)
+        Supremum of sets of the other sizes is computed by TSym.sup_iter.
+
         Rules determining supremum are as follows:
             1. Sup(a1, ..., ap, a(p+1)) => Sup(Sup(a1, ..., ap), a(p+1)).                      [SupRec]
             2. Sup() => Void.                                                                  [SupVoid]
@@ -169,90 +335,186 @@ class TSym:
 
         :return: Supremum of set_. None if it does not exists.
         """
-        if len(set_) == 0:
-            return VoidTSym()
-        elif len(set_) == 1:
-            # [SupSngl]
-            return set_[0]
-        elif len(set_) > 2:
-            # [SupRec]
-            t: Optional[TSym] = TSym.sup(*set_[:-1])
-            return None if t is None else TSym.sup(t, set_[-1])
-
-        if set_[0].__base:
-            if set_[1].__base:
-                # [SupSub]
-                if set_[0] <= set_[1]:
-                    return set_[1]
-                elif set_[1] <= set_[0]:
-                    return set_[0]
+        if len(set_) != 2:
+            return TSym.sup_iter(set_)
+
+        key: Tuple[int, int] = (id(set_[0]), id(set_[1]))
+        hit: Optional[Tuple[TSym, TSym, Optional[TSym]]] = TSym.__sup_cache.get(key)
+
+        if hit is not None:
+            return hit[2]
+
+        if len(TSym.__sup_cache) >= TSym.__SUP_CACHE_SZ:
+            TSym.__sup_cache.clear()
+
+        t: Optional[TSym] = TSym.__sup_pair(set_[0], set_[1])
+        TSym.__sup_cache[key] = (set_[0], set_[1], t)
+
+        return t
+
+    @staticmethod
+    def sup_iter(set_: Iterable[TSym]) -> Optional[TSym]:
+        """
+        Computes supremum of the given type set, which is given as an iterable.
+
+        Unlike TSym.sup, the set is consumed directly, without packing it into a tuple of arguments.
+        It folds the set from left to right in a single pass. (Refer to the rules in the comments of TSym.sup.)
+        While types are base types or arrays of base types, which is the most common case,
+        [SupBaseArr] and [SupArr] reduce to the supremum of element types and the maximum of depths.
+        Thus the fold is done on element types and depths, and array type is constructed only when it is needed.
+        Once the other type is encountered, the fold continues with pairwise supremum.
+
+        :param set_: Set of types whose supremum is to be computed.
+
+        :return: Supremum of set_. None if it does not exists.
+        """
+        it: Iterator[TSym] = iter(set_)
+        t: Optional[TSym] = next(it, None)
+
+        if t is None:
+            # [SupVoid]
+            return VOID_T
+
+        if t._base:
+            elem, dept = t, 0
+        elif t._t is T.ARR and t._elem._base:
+            elem, dept = t._elem, t._dept
+        else:
+            elem, dept = None, 0
+
+        if elem is not None:
+            for t in it:
+                if t._base:
+                    elem = TSym.sup(elem, t)
+                elif t._t is T.ARR and t._elem._base:
+                    elem = TSym.sup(elem, t._elem)
+                    dept = max(dept, t._dept)
                 else:
+                    t = TSym.sup(elem if dept == 0 else ArrTSym(elem, dept), t)
+                    break
+
+                if elem is None:
                     return None
-            elif set_[1].__t == T.ARR:
+            else:
+                return elem if dept == 0 else ArrTSym(elem, dept)
+
+        # [SupRec]
+        for elem in it:
+            if t is None:
+                return None
+
+            t = TSym.sup(t, elem)
+
+        return t
+
+    @staticmethod
+    def __sup_pair(*set_: TSym) -> Optional[TSym]:
+        """
+        Computes supremum of two types without cache.
+
+        For detailed rules, refer to the comments of TSym.sup.
+
+        :param set_: Two types whose supremum is to be computed.
+
+        :return: Supremum of set_. None if it does not exists.
+        """
+        # Operands and their type tags are bound to local variables since they are referred many times below.
+        a, b = set_
+        a_t, b_t = a._t, b._t
+        arr: T = T.ARR
+
+        # [SupSub]
+        # It is tested first for all types, not only for base types, since subtype relation is cached.
+        # If one is a subtype of the other, which is the common case of widening, no structural merge is needed.
+        if a <= b:
+            return b
+        elif b <= a:
+            return a
+
+        if a._base:
+            if b._base:
+                return None
+            elif b_t is arr:
                 # [SupBaseArr]
-                elem: Optional[TSym] = TSym.sup(set_[0], set_[1].elem)
+                elem: Optional[TSym] = TSym.sup(a, b._elem)
 
-                return None if elem is None else ArrTSym(elem, set_[1].dept)
+                return None if elem is None else ArrTSym(elem, b._dept)
             else:
                 return None
-        elif set_[0].__t == T.ARR:
-            if set_[1].__base:
+        elif a_t is arr:
+            if b._base:
                 # [SupBaseArr]
-                elem: Optional[TSym] = TSym.sup(set_[0].elem, set_[1])
+                elem: Optional[TSym] = TSym.sup(a._elem, b)
 
-                return None if elem is None else ArrTSym(elem, set_[0].dept)
-            elif set_[1].__t == T.ARR:
+                return None if elem is None else ArrTSym(elem, a._dept)
+            elif b_t is arr:
                 # [SupArr]
-                elem: Optional[TSym] = TSym.sup(set_[0].elem, set_[1].elem)
+                elem: Optional[TSym] = TSym.sup(a._elem, b._elem)
 
-                return None if elem is None else ArrTSym(elem, max(set_[0].dept, set_[1].dept))
+                return None if elem is None else ArrTSym(elem, max(a._dept, b._dept))
             else:
                 return None
 
-        if set_[0].__t != set_[1].__t:
+        if a_t is not b_t:
             return None
 
-        if set_[0].__t == T.STRT:
-            # [SupStrt]
-            if len(set_[0].elem) != len(set_[1].elem):
-                return None
+        hndl: Optional[Callable] = TSym.__SUP_HNDL[a_t]
 
-            elem: Dict[str, TSym] = {}
+        return None if hndl is None else hndl(a, b)
 
-            for k, t1 in set_[0].elem.items():
-                t2: Optional[TSym] = set_[1].elem.get(k, None)
+    @staticmethod
+    def __sup_strt(a: StrtTSym, b: StrtTSym) -> Optional[TSym]:
+        # [SupStrt]
+        # Ids of members are compared at once as key views, and then types of members are merged in the order of a,
+        # which is the order of members of the supremum.
+        if a._elem.keys() != b._elem.keys():
+            return None
 
-                if t2 is None:
-                    return None
+        elem: Dict[str, TSym] = {}
+        b_elem: Dict[str, TSym] = b._elem
 
-                t: Optional[TSym] = TSym.sup(t1, t2)
+        for k, t1 in a._elem.items():
+            t: Optional[TSym] = TSym.sup(t1, b_elem[k])
 
-                if t is None:
-                    return None
+            if t is None:
+                return None
 
-                elem[k] = t
+            elem[k] = t
 
-            return StrtTSym(elem)
-        elif set_[0].__t == T.FUN:
-            # [SupFun]
-            if len(set_[0].args) != len(set_[1].args):
-                return None
+        return StrtTSym(elem)
 
-            args: List[TSym] = []
+    @staticmethod
+    def __sup_fun(a: FunTSym, b: FunTSym) -> Optional[TSym]:
+        # [SupFun]
+        if len(a._args) != len(b._args):
+            return None
 
-            for i in range(len(set_[0].args)):
-                elem: Optional[TSym] = TSym.sup(set_[0].args[i], set_[1].args[i])
+        args: List[TSym] = []
 
-                if elem is None:
-                    return None
+        for t1, t2 in zip(a._args, b._args):
+            elem: Optional[TSym] = TSym.sup(t1, t2)
 
-                args.append(elem)
+            if elem is None:
+                return None
 
-            ret: Optional[TSym] = TSym.sup(set_[0].ret, set_[1].ret)
+            args.append(elem)
 
-            return None if elem is None else FunTSym(args, ret)
+        ret: Optional[TSym] = TSym.sup(a._ret, b._ret)
 
-        return None
+        return None if ret is None else FunTSym(args, ret)
+
+    # Logic for equality, subtype relation, and supremum of composite types, indexed by symbol types.
+    # Logic for equality and subtype relation returns pairs of components to be tested further, or None on failure.
+    # (Refer to TSym.__eq_walk and TSym.__le_walk.)
+    # For equality and supremum, both types have the same symbol type and tables are indexed by it.
+    # For subtype relation, tables are indexed by the symbol type of the supertype.
+    # Symbol types without entries have no rules to apply.
+    __EQ_HNDL: Final[ClassVar[List[Optional[Callable]]]] = [None] * (max(T) + 1)
+    __EQ_HNDL[T.ARR], __EQ_HNDL[T.STRT], __EQ_HNDL[T.FUN] = __eq_arr, __eq_strt, __eq_fun
+    __LE_HNDL: Final[ClassVar[List[Optional[Callable]]]] = [None] * (max(T) + 1)
+    __LE_HNDL[T.ARR], __LE_HNDL[T.STRT], __LE_HNDL[T.FUN] = __le_arr, __le_strt, __le_fun
+    __SUP_HNDL: Final[ClassVar[List[Optional[Callable]]]] = [None] * (max(T) + 1)
+    __SUP_HNDL[T.STRT], __SUP_HNDL[T.FUN] = __sup_strt, __sup_fun
 
     """
     GETTER & SETTER
@@ -260,22 +522,37 @@ class TSym:
 
     @property
     def t(self) -> T:
-        return self.__t
+        return self._t
 
     @property
     def base(self) -> bool:
-        return self.__base
+        return self._base
 
 
 """
 BASE TYPE: NUMERIC, STRING, BOOLEAN, AND VOID.
 
+Since all base types of the same kind are identical, following classes are implemented as singletons.
+Thus base types can be compared by identity, and no allocation happens when they are instantiated repeatedly.
+For convenience, the singleton objects are also exported as module constants, NUM_T, STR_T, BOOL_T, and VOID_T.
+
 Following classes are the end of inheritance. No further inheritance is allowed.
 """
 
 
 @final
 class NumTSym(TSym):
+    __slots__ = ()
+
+    # Singleton object.
+    __inst: ClassVar[NumTSym] = None
+
+    def __new__(cls) -> NumTSym:
+        if not cls.__inst:
+            NumTSym.__inst = super().__new__(cls)
+
+        return cls.__inst
+
     def __init__(self) -> None:
         super().__init__(T.NUM)
 
@@ -287,6 +564,17 @@ class NumTSym(TSym):
 
 @final
 class StrTSym(TSym):
+    __slots__ = ()
+
+    # Singleton object.
+    __inst: ClassVar[StrTSym] = None
+
+    def __new__(cls) -> StrTSym:
+        if not cls.__inst:
+            StrTSym.__inst = super().__new__(cls)
+
+        return cls.__inst
+
     def __init__(self) -> None:
         super().__init__(T.STR)
 
@@ -298,6 +586,17 @@ class StrTSym(TSym):
 
 @final
 class BoolTSym(TSym):
+    __slots__ = ()
+
+    # Singleton object.
+    __inst: ClassVar[BoolTSym] = None
+
+    def __new__(cls) -> BoolTSym:
+        if not cls.__inst:
+            BoolTSym.__inst = super().__new__(cls)
+
+        return cls.__inst
+
     def __init__(self) -> None:
         super().__init__(T.BOOL)
 
@@ -309,6 +608,17 @@ class BoolTSym(TSym):
 
 @final
 class VoidTSym(TSym):
+    __slots__ = ()
+
+    # Singleton object.
+    __inst: ClassVar[VoidTSym] = None
+
+    def __new__(cls) -> VoidTSym:
+        if not cls.__inst:
+            VoidTSym.__inst = super().__new__(cls)
+
+        return cls.__inst
+
     def __init__(self) -> None:
         super().__init__(T.VOID)
 
@@ -318,6 +628,11 @@ class VoidTSym(TSym):
     __repr__ = __str__
 
 
+NUM_T: Final[NumTSym] = NumTSym()
+STR_T: Final[StrTSym] = StrTSym()
+BOOL_T: Final[BoolTSym] = BoolTSym()
+VOID_T: Final[VoidTSym] = VoidTSym()
+
 """
 COMPOSITE TYPE: ARRAY, STRUCT, AND FUNCTION
 
@@ -327,75 +642,180 @@ Note that all elements of an array must be identical.
 Struct type is defined by the dictionary which contains ids of members and their types.
 Struct type with no members at all is valid.
 
-Function type is defined by the list composed of the types of arguments and the return type.
+Function type is defined by the tuple composed of the types of arguments and the return type.
 Function type with no input arguments is valid, but missing or multiple return types are not.
 
+Composite types are pooled(hash-consed) by their components,
+so that composite types built from the same components are identical and equality mostly reduces to identity.
+Since the pools are bounded and flushed when full, equal composite types are not guaranteed to be identical.
+Thus equality still falls back to structural comparison.
+
 Following classes are the end of inheritance. No further inheritance is allowed.
 """
 
 
 @final
 class ArrTSym(TSym):
+    __slots__ = ('_elem', '_dept', '_str')
+
+    # Pool of array types.
+    # Keys are ids of element types and depths, and element types are kept alive by the pooled array types.
+    __pool: ClassVar[Dict[Tuple[int, int], ArrTSym]] = {}
+    # Maximum # of entries of the pool. If it is exceeded, the pool is flushed.
+    __POOL_SZ: Final[ClassVar[int]] = 4096
+
+    def __new__(cls, elem: TSym, dept: int) -> ArrTSym:
+        key: Tuple[int, int] = (id(elem), dept)
+        inst: Optional[ArrTSym] = cls.__pool.get(key)
+
+        if inst is None:
+            if len(cls.__pool) >= cls.__POOL_SZ:
+                cls.__pool.clear()
+
+            inst = super().__new__(cls)
+            TSym.__init__(inst, T.ARR)
+            # Type of elements.
+            inst._elem: TSym = elem
+            # Depth(# of dimensions)
+            inst._dept: int = dept
+            # [EqArr] compares symbol types of elements, and so does the hash.
+            inst._hash = hash((T.ARR, elem._t, dept))
+            # String representation. It is rendered at the first request and then cached.
+            inst._str: Optional[str] = None
+            cls.__pool[key] = inst
+
+        return inst
+
     def __init__(self, elem: TSym, dept: int) -> None:
-        super().__init__(T.ARR)
-        # Type of elements.
-        self.__elem: TSym = elem
-        # Depth(# of dimensions)
-        self.__dept: int = dept
+        # Fields are initialized only once by ArrTSym.__new__, when the pooled instance is constructed.
+        pass
 
     def __str__(self) -> str:
-        return f'Arr[{self.__elem}, {self.__dept}]'
+        if self._str is None:
+            self._str = f'Arr[{self._elem}, {self._dept}]'
+
+        return self._str
 
     __repr__ = __str__
 
     @property
     def elem(self) -> TSym:
-        return self.__elem
+        return self._elem
 
     @property
     def dept(self) -> int:
-        return self.__dept
+        return self._dept
 
 
 @final
 class StrtTSym(TSym):
+    __slots__ = ('_elem', '_items', '_str')
+
+    # Pool of struct types.
+    # Keys are ids of members with the ids of their types, and member types are kept alive by the pooled struct types.
+    __pool: ClassVar[Dict[Tuple[Tuple[str, int], ...], StrtTSym]] = {}
+    # Maximum # of entries of the pool. If it is exceeded, the pool is flushed.
+    __POOL_SZ: Final[ClassVar[int]] = 4096
+
+    def __new__(cls, elem: Dict[str, TSym]) -> StrtTSym:
+        key: Tuple[Tuple[str, int], ...] = tuple((k, id(t)) for k, t in elem.items())
+        inst: Optional[StrtTSym] = cls.__pool.get(key)
+
+        if inst is None:
+            if len(cls.__pool) >= cls.__POOL_SZ:
+                cls.__pool.clear()
+
+            inst = super().__new__(cls)
+            TSym.__init__(inst, T.STRT)
+            # Types of members with their ids. Can be an empty dictionary which represents an empty struct.
+            inst._elem: Dict[str, TSym] = elem
+            # Pairs of ids and types of members, sorted by ids. It is used for fast pairwise comparison.
+            inst._items: Tuple[Tuple[str, TSym], ...] = tuple(sorted(elem.items(), key=lambda item: item[0]))
+            inst._hash = hash((T.STRT, inst._items))
+            # String representation. It is rendered at the first request and then cached.
+            inst._str: Optional[str] = None
+            cls.__pool[key] = inst
+
+        return inst
+
     def __init__(self, elem: Dict[str, TSym]) -> None:
-        super().__init__(T.STRT)
-        # Types of members with their ids. Can be an empty dictionary which represents an empty struct.
-        self.__elem: Dict[str, TSym] = elem
+        # Fields are initialized only once by StrtTSym.__new__, when the pooled instance is constructed.
+        pass
 
     def __str__(self) -> str:
-        return str(self.__elem)
+        if self._str is None:
+            self._str = str(self._elem)
+
+        return self._str
 
     __repr__ = __str__
 
     @property
     def elem(self) -> Dict[str, TSym]:
-        return self.__elem
+        return self._elem
+
+    @property
+    def items(self) -> Tuple[Tuple[str, TSym], ...]:
+        return self._items
 
 
 @final
 class FunTSym(TSym):
-    def __init__(self, args: List[TSym], ret: TSym) -> None:
-        super().__init__(T.FUN)
-        # Argument types. Can be an empty list which represents function with no input arguments.
-        self.__args: List[TSym] = args
-        self.__ret: TSym = ret
+    __slots__ = ('_args', '_ret', '_sgntr', '_str')
+
+    # Pool of function types.
+    # Keys are ids of argument types and return type, which are kept alive by the pooled function types.
+    __pool: ClassVar[Dict[Tuple[Tuple[int, ...], int], FunTSym]] = {}
+    # Maximum # of entries of the pool. If it is exceeded, the pool is flushed.
+    __POOL_SZ: Final[ClassVar[int]] = 4096
+
+    def __new__(cls, args: Sequence[TSym], ret: TSym) -> FunTSym:
+        key: Tuple[Tuple[int, ...], int] = (tuple(map(id, args)), id(ret))
+        inst: Optional[FunTSym] = cls.__pool.get(key)
+
+        if inst is None:
+            if len(cls.__pool) >= cls.__POOL_SZ:
+                cls.__pool.clear()
+
+            inst = super().__new__(cls)
+            TSym.__init__(inst, T.FUN)
+            # Argument types. Can be an empty tuple which represents function with no input arguments.
+            # It is frozen as a tuple since type symbols are never modified once constructed.
+            inst._args: Tuple[TSym, ...] = tuple(args)
+            inst._ret: TSym = ret
+            # Hash of the signature, computed from symbol types of arguments and return type.
+            inst._sgntr: int = hash((tuple(arg.t for arg in inst._args), ret.t))
+            inst._hash = hash((T.FUN, inst._args, ret))
+            # String representation. It is rendered at the first request and then cached.
+            inst._str: Optional[str] = None
+            cls.__pool[key] = inst
+
+        return inst
+
+    def __init__(self, args: Sequence[TSym], ret: TSym) -> None:
+        # Fields are initialized only once by FunTSym.__new__, when the pooled instance is constructed.
+        pass
 
     def __str__(self) -> str:
-        args: str = ', '.join(map(str, self.__args))
+        if self._str is None:
+            args: str = ', '.join(map(str, self._args))
+            self._str = f'({args}) => {self._ret}'
 
-        return f'({args}) => {self.__ret}'
+        return self._str
 
     __repr__ = __str__
 
     @property
-    def args(self) -> List[TSym]:
-        return self.__args
+    def args(self) -> Tuple[TSym, ...]:
+        return self._args
 
     @property
     def ret(self) -> TSym:
-        return self.__ret
+        return self._ret
+
+    @property
+    def sgntr(self) -> int:
+        return self._sgntr
 
 
 """
@@ -17,15 +17,27 @@ class Err(Exception):
     This class should not be directly instantiated.
     Instead, use this class as a wild card meaning 'any custom exceptions'.
     """
+    __slots__ = ('_pos', '_line', '_line_strp', '_errno')
 
     def __init__(self, pos: int, line: str, errno: Errno) -> None:
         # Position in the raw input string where the exception is raised.
         self._pos: int = pos
         # Raw input string.
         self._line: str = line
+        # Raw input string without trailing whitespaces.
+        self._line_strp: str = line.rstrip()
         # Errno.
         self._errno: Errno = errno
 
+    """
+    BUILT-IN OVERRIDING
+    """
+
+    def __str__(self) -> str:
+        # Error message is formatted on demand, not at construction.
+        # Exceptions from Class and Function modules have no position until Interp assigns it.
+        return super().__str__() if self._pos is None else self.msg
+
     """
     GETTER & SETTER
     """
@@ -55,7 +67,7 @@ class Err(Exception):
 
         :return: Error message.
         """
-        return self._line.rstrip() + '\n' + '~' * self._pos + '^\n'
+        return f'{self._line_strp}\n{"~" * self._pos}^\n'
 
     @pos.setter
     def pos(self, pos: int) -> NoReturn:
@@ -64,6 +76,7 @@ class Err(Exception):
     @line.setter
     def line(self, line: str) -> NoReturn:
         self._line = line
+        self._line_strp = line.rstrip()
 
 
 """
@@ -87,6 +100,21 @@ class ParserErr(Err):
 
     This class is the end of inheritance. No further inheritance is allowed.
     """
+    __slots__ = ()
+
+    # Additional error messages with no varying part. They are colored only once here.
+    __INCOMP_EXPR: Final[ClassVar[str]] = Printer.as_red('[Invalid syntax] Expression is incomplete.')
+    __ARG_MISPOS: Final[ClassVar[str]] = Printer.as_red('[Invalid syntax] Only keyword arguments can be placed here.')
+    __MEMID_MISS: Final[ClassVar[str]] = Printer.as_red('[Invalid syntax] Member id is missing.')
+    # Formatters for additional error messages, indexed by errno.
+    __FMT: Final[ClassVar[Dict[Errno, Callable[[ParserErr], str]]]] = {
+        Errno.INVALID_TOK: lambda e: Printer.as_red(f'[Invalid syntax] Unexpected token encountered at {e._pos}.'),
+        Errno.NCLOSED_PARN: lambda e: Printer.as_red(f'[Invalid syntax] Parenthesis(quote) at {e._pos} is not closed.'),
+        Errno.INCOMP_EXPR: lambda e: ParserErr.__INCOMP_EXPR,
+        Errno.FUN_CALL_MISS: lambda e: Printer.as_red(f'[Invalid syntax] Function call at {e._pos} is not complete.'),
+        Errno.ARG_MISPOS: lambda e: ParserErr.__ARG_MISPOS,
+        Errno.MEMID_MISS: lambda e: ParserErr.__MEMID_MISS
+    }
 
     def __init__(self, pos: int, line: str, errno: Errno) -> None:
         super().__init__(pos, line, errno)
@@ -107,22 +135,9 @@ class ParserErr(Err):
 
         :return: Error message.
         """
-        msg: str = self._line.rstrip() + '\n' + '~' * self._pos + '^\n'
-
-        if self._errno == Errno.INVALID_TOK:
-            msg += Printer.as_red(f'[Invalid syntax] Unexpected token encountered at {self._pos}.')
-        elif self._errno == Errno.NCLOSED_PARN:
-            msg += Printer.as_red(f'[Invalid syntax] Parenthesis(quote) at {self._pos} is not closed.')
-        elif self._errno == Errno.INCOMP_EXPR:
-            msg += Printer.as_red('[Invalid syntax] Expression is incomplete.')
-        elif self._errno == Errno.FUN_CALL_MISS:
-            msg += Printer.as_red(f'[Invalid syntax] Function call at {self._pos} is not complete.')
-        elif self._errno == Errno.ARG_MISPOS:
-            msg += Printer.as_red('[Invalid syntax] Only keyword arguments can be placed here.')
-        elif self._errno == Errno.MEMID_MISS:
-            msg += Printer.as_red('[Invalid syntax] Member id is missing.')
+        fmt: Optional[Callable[[ParserErr], str]] = ParserErr.__FMT.get(self._errno)
 
-        return msg
+        return super().msg if fmt is None else super().msg + fmt(self)
 
 
 @final
@@ -141,10 +156,28 @@ class SemanticChkErr(Err):
 
     This class is the end of inheritance. No further inheritance is allowed.
     """
+    __slots__ = ('_info',)
+
+    # Formatters for additional error messages, indexed by errno.
+    __FMT: Final[ClassVar[Dict[Errno, Callable[[SemanticChkErr], str]]]] = {
+        Errno.INHOMO_ELEM:
+            lambda e: Printer.as_red(f'[Type error] Types of elements consisting a vector are not homogeneous.\n'
+                                     f'             Inferred type is [{e._info["infer"]}].'),
+        Errno.SGNTR_NFOUND:
+            lambda e: Printer.as_red(f'[Type error] Signature for function call(operator) does not match.\n'
+                                     f'             Inferred type is {e._info["infer"]}.'),
+        Errno.NOT_DEFINE: lambda e: Printer.as_red(f'[Semantic error] Variable {e._info["var"]} is not defined.'),
+        Errno.ASGN_T_MISS:
+            lambda e: Printer.as_red(f'[Type error] You cannot assign {e._info["val_t"]} to {e._info["tar_t"]}.'),
+        Errno.INVALID_LVAL:
+            lambda e: Printer.as_red(f'[Semantic error] The LHS of assignment at {e._pos} cannot be a l-value.'),
+        Errno.ID_DUP: lambda e: Printer.as_red(f'[Semantic error] Struct member id {e._info["id_"]} is duplicated.')
+    }
 
     def __init__(self, pos: int, line: str, errno: Errno, **kwargs) -> None:
         super().__init__(pos, line, errno)
-        self.__info: Dict[str, Any] = kwargs
+        # Additional information for error message.
+        self._info: Dict[str, Any] = kwargs
 
     @property
     def msg(self) -> str:
@@ -164,29 +197,9 @@ class SemanticChkErr(Err):
 
         :return: Error message.
         """
-        msg: str = self._line.rstrip() + '\n' + '~' * self._pos + '^\n'
-
-        if self._errno == Errno.INHOMO_ELEM:
-            infer: str = self.__info['infer']
-            msg += Printer.as_red(f'[Type error] Types of elements consisting a vector are not homogeneous.\n')
-            msg += Printer.as_red(f'             Inferred type is [{infer}].')
-        elif self._errno == Errno.SGNTR_NFOUND:
-            infer: str = self.__info['infer']
-            msg += Printer.as_red(f'[Type error] Signature for function call(operator) does not match.\n')
-            msg += Printer.as_red(f'             Inferred type is {infer}.')
-        elif self._errno == Errno.NOT_DEFINE:
-            var: str = self.__info['var']
-            msg += Printer.as_red(f'[Semantic error] Variable {var} is not defined.')
-        elif self._errno == Errno.ASGN_T_MISS:
-            tar_t, val_t = self.__info['tar_t'], self.__info['val_t']
-            msg += Printer.as_red(f'[Type error] You cannot assign {val_t} to {tar_t}.')
-        elif self._errno == Errno.INVALID_LVAL:
-            msg += Printer.as_red(f'[Semantic error] The LHS of assignment at {self._pos} cannot be a l-value.')
-        elif self._errno == Errno.ID_DUP:
-            id_: str = self.__info['id_']
-            msg += Printer.as_red(f'[Semantic error] Struct member id {id_} is duplicated.')
-
-        return msg
+        fmt: Optional[Callable[[SemanticChkErr], str]] = SemanticChkErr.__FMT.get(self._errno)
+
+        return super().msg if fmt is None else super().msg + fmt(self)
 
 
 class InterpErr(Err):
@@ -200,11 +213,30 @@ class InterpErr(Err):
 
     Exceptions raised by modules in Class or Function packages must inherit this class.
     This class can be used as a root class catching all exceptions raised during various computations.
+    Additional information for error message is shared with subclasses through the slot _info.
     """
+    __slots__ = ('_info',)
+
+    __NOT_IMPLE: Final[ClassVar[str]] = \
+        Printer.as_red('[Not implemented] This functionality is not implemented yet. Sorry.')
+    # Formatter for DIM_MISMATCH. It is shared with subclasses which raise the same errno.
+    _DIM_MISMATCH_FMT: Final[ClassVar[Callable[[InterpErr], str]]] = \
+        lambda e: Printer.as_red(f'[Invalid operation] Dimension mismatch occurred during {e._info["op"]}.\n'
+                                 f'                    Dimensions {e._info["dim1"]} and {e._info["dim2"]} '
+                                 f'are not compatible.')
+    # Formatters for additional error messages, indexed by errno.
+    __FMT: Final[ClassVar[Dict[Errno, Callable[[InterpErr], str]]]] = {
+        Errno.KERNEL_ERR:
+            lambda e: Printer.as_red(f'[Kernel error] Python kernel reported an error during computation.\n'
+                                     f'               Message from the kernel: {e._info["k_msg"]}'),
+        Errno.NOT_IMPLE: lambda e: InterpErr.__NOT_IMPLE,
+        Errno.DIM_MISMATCH: _DIM_MISMATCH_FMT
+    }
 
     def __init__(self, pos: int, line: str, errno: Errno, **kwargs) -> None:
         super().__init__(pos, line, errno)
-        self.__info: Dict[str, Any] = kwargs
+        # Additional information for error message.
+        self._info: Dict[str, Any] = kwargs
 
     @property
     def msg(self) -> str:
@@ -221,19 +253,9 @@ class InterpErr(Err):
 
         :return: Error message.
         """
-        msg: str = self._line.rstrip() + '\n' + '~' * self._pos + '^\n'
+        fmt: Optional[Callable[[InterpErr], str]] = InterpErr.__FMT.get(self._errno)
 
-        if self._errno == Errno.KERNEL_ERR:
-            k_msg: str = self.__info['k_msg']
-            msg += Printer.as_red(f'[Kernel error] Python kernel reported an error during computation.\n')
-            msg += Printer.as_red(f'               Message from the kernel: {k_msg}')
-        elif self._errno == Errno.NOT_IMPLE:
-            msg += Printer.as_red(f'[Not implemented] This functionality is not implemented yet. Sorry.')
-        elif self._errno == Errno.DIM_MISMATCH:
-            op, dim1, dim2 = self.__info['op'], self.__info['dim1'], self.__info['dim2']
-            msg += Printer.as_red(f'[Invalid operation] Dimension mismatch occurred during {op}.\n')
-            msg += Printer.as_red(f'                    Dimensions {dim1} and {dim2} are not compatible.')
-        return msg
+        return super().msg if fmt is None else super().msg + fmt(self)
 
 
 """
@@ -257,10 +279,24 @@ class ArrErr(InterpErr):
 
     This class is the end of inheritance. No further inheritance is allowed.
     """
+    __slots__ = ()
+
+    __EMPTY_IDX: Final[ClassVar[str]] = Printer.as_red('[Invalid operation] Empty index list is not allowed.')
+    # Formatters for additional error messages, indexed by errno.
+    __FMT: Final[ClassVar[Dict[Errno, Callable[[ArrErr], str]]]] = {
+        Errno.DIM_MISMATCH: InterpErr._DIM_MISMATCH_FMT,
+        Errno.EMPTY_IDX: lambda e: ArrErr.__EMPTY_IDX,
+        Errno.IDX_BOUND:
+            lambda e: Printer.as_red(f'[Invalid operation] Index out of bound. '
+                                     f'There is no element at {e._info["idx"]}.'),
+        Errno.ASGN_N_MISS:
+            lambda e: Printer.as_red(f'[Semantic error] You provided {e._info["given"]} elements for assignment, '
+                                     f'but it needs (only) {e._info["need"]} elements.')
+    }
 
     def __init__(self, errno: Errno, **kwargs) -> None:
         super().__init__(kwargs.get('pos', None), '', errno)
-        self.__info: Dict[str, Any] = kwargs
+        self._info = kwargs
 
     @property
     def msg(self) -> str:
@@ -277,42 +313,36 @@ class ArrErr(InterpErr):
 
         :return: Error message.
         """
-        msg: str = self._line.rstrip() + '\n' + '~' * self._pos + '^\n'
-
-        if self._errno == Errno.DIM_MISMATCH:
-            op, dim1, dim2 = self.__info['op'], self.__info['dim1'], self.__info['dim2']
-            msg += Printer.as_red(f'[Invalid operation] Dimension mismatch occurred during {op}.\n')
-            msg += Printer.as_red(f'                    Dimensions {dim1} and {dim2} are not compatible.')
-        elif self._errno == Errno.EMPTY_IDX:
-            msg += Printer.as_red(f'[Invalid operation] Empty index list is not allowed.')
-        elif self._errno == Errno.IDX_BOUND:
-            idx: int = self.__info['idx']
-            msg += Printer.as_red(f'[Invalid operation] Index out of bound. There is no element at {idx}.')
-        elif self._errno == Errno.ASGN_N_MISS:
-            need, given = self.__info['need'], self.__info['given']
-            msg += Printer.as_red(f'[Semantic error] You provided {given} elements for assignment, '
-                                  f'but it needs (only) {need} elements.')
+        # InterpErr.msg is bypassed since additional messages there are for InterpErr itself.
+        msg: str = super(InterpErr, self).msg
+        fmt: Optional[Callable[[ArrErr], str]] = ArrErr.__FMT.get(self._errno)
 
-        return msg
+        return msg if fmt is None else msg + fmt(self)
 
 
 # TODO: Is complete? I don't think so...
 @final
 class FunErr(InterpErr):
+    __slots__ = ()
+
+    # Formatters for additional error messages, indexed by errno.
+    __FMT: Final[ClassVar[Dict[Errno, Callable[[FunErr], str]]]] = {
+        Errno.FUN_ERR:
+            lambda e: Printer.as_red('[Matrix error] Matrix module reported as error during computation.\n'
+                                     f'               Message from the module: {e._info["detail"]}')
+    }
+
     def __init__(self, errno: Errno, **kwargs) -> None:
         super().__init__(kwargs.get('pos', None), '', errno)
-        self.__info: Dict[str, Any] = kwargs
+        self._info = kwargs
 
     @property
     def msg(self) -> str:
-        msg: str = self._line.rstrip() + '\n' + '~' * self._pos + '^\n'
-
-        if self._errno == Errno.FUN_ERR:
-            detail = self.__info['detail']
-            msg += Printer.as_red('[Matrix error] Matrix module reported as error during computation.\n')
-            msg += Printer.as_red(f'               Message from the module: {detail}')
+        # InterpErr.msg is bypassed since additional messages there are for InterpErr itself.
+        msg: str = super(InterpErr, self).msg
+        fmt: Optional[Callable[[FunErr], str]] = FunErr.__FMT.get(self._errno)
 
-        return msg
+        return msg if fmt is None else msg + fmt(self)
 
 
 """
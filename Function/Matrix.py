@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from math import isqrt
 from Class.Array import *
 from Class.Function import *
 from Core.SymbolTable import *
@@ -18,108 +19,114 @@ class MatFun:
 
     @staticmethod
     def init() -> NoReturn:
-        SymTab.inst().update_kw(
-            'oMat',
-            Fun(MatFun.o_mat,
-                FunTSym([NumTSym()], ArrTSym(NumTSym(), 2))
-                )
-        )
-        SymTab.inst().update_kw(
-            'zMat',
-            Fun(MatFun.z_mat,
-                FunTSym([NumTSym()], ArrTSym(NumTSym(), 2))
-                )
-        )
-        SymTab.inst().update_kw(
-            'idMat',
-            Fun(MatFun.id_mat,
-                FunTSym([NumTSym()], ArrTSym(NumTSym(), 2))
-                )
-        )
-        SymTab.inst().update_kw(
-            'diagComp',
-            Fun(MatFun.diag_comp,
-                FunTSym([ArrTSym(NumTSym(), 2), BoolTSym()], ArrTSym(NumTSym(), 1)),
-                [('anti', 'F')])
-        )
-        SymTab.inst().update_kw(
-            'diagMat',
-            Fun(MatFun.diag_mat,
-                FunTSym([ArrTSym(NumTSym(), 1), BoolTSym()], ArrTSym(NumTSym(), 2)),
-                [('anti', 'F')])
-        )
-        SymTab.inst().update_kw(
-            'triComp',
-            Fun(MatFun.tri_comp,
-                FunTSym([ArrTSym(NumTSym(), 2), BoolTSym(), BoolTSym()], ArrTSym(NumTSym(), 2)),
-                [('strict', 'T'), ('lower', 'T')]
-                )
-        )
-        SymTab.inst().update_kw(
-            'triMat',
-            Fun(MatFun.tri_mat,
-                FunTSym([ArrTSym(NumTSym(), 1), BoolTSym(), BoolTSym()], ArrTSym(NumTSym(), 2)),
-                [('strict', 'T'), ('lower', 'T')]
-                )
-        )
-        SymTab.inst().update_kw(
-            'rbind',
-            Fun(MatFun.rbind,
-                FunTSym([ArrTSym(NumTSym(), 2), ArrTSym(NumTSym(), 2)], ArrTSym(NumTSym(), 2))
-                )
-        )
-        SymTab.inst().update_kw(
-            'cbind',
-            Fun(MatFun.cbind,
-                FunTSym([ArrTSym(NumTSym(), 2), ArrTSym(NumTSym(), 2)], ArrTSym(NumTSym(), 2))
-                )
-        )
-        SymTab.inst().update_kw(
-            't',
-            Fun(MatFun.t,
-                FunTSym([ArrTSym(NumTSym(), 2)], ArrTSym(NumTSym(), 2))
-                )
-        )
-        SymTab.inst().update_kw(
-            'lu',
-            Fun(MatFun.lu,
-                FunTSym([ArrTSym(NumTSym(), 2), BoolTSym()],
-                        StrtTSym({'L': ArrTSym(NumTSym(), 2), 'U': ArrTSym(NumTSym(), 2)}))
-                )
-        )
-        # SymTab.inst().update_kw(
-        #     'lu__',
-        #     Fun(MatFun.lu__,
-        #         FunTSym([ArrTSym(NumTSym(), 2), BoolTSym()],
-        #                 StrtTSym({'LU': ArrTSym(NumTSym(), 2), 'p': ArrTSym(NumTSym(), 1), 'q': ArrTSym(NumTSym(), 1),
-        #                           'flag': NumTSym()}))
-        #         )
-        # )
-        SymTab.inst().update_kw(
-            'chol',
-            Fun(MatFun.chol,
-                FunTSym([ArrTSym(NumTSym(), 2)], StrtTSym({'L': ArrTSym(NumTSym(), 2)}))
-                )
-        )
-        # SymTab.inst().update_kw(
-        #     'chol__',
-        #     Fun(MatFun.chol__,
-        #         FunTSym([ArrTSym(NumTSym(), 2)], StrtTSym({'L': ArrTSym(NumTSym(), 2), 'flag': NumTSym()}))
-        #         )
-        # )
-        SymTab.inst().update_kw(
-            'qr',
-            Fun(MatFun.qr,
-                FunTSym([ArrTSym(NumTSym(), 2)], StrtTSym({'Q': ArrTSym(NumTSym(), 2), 'R': ArrTSym(NumTSym(), 2)}))
-                )
-        )
-        # SymTab.inst().update_kw(
-        #     'qr__',
-        #     Fun(MatFun.qr__,
-        #         FunTSym([ArrTSym(NumTSym(), 2)],
-        #                 StrtTSym({'QR': ArrTSym(NumTSym(), 2), 'aux': ArrTSym(NumTSym(), 1), 'flag': NumTSym()}))
-        #         )
-        # )
+        # Type symbols used repeatedly in signatures below. They are shared rather than looked up at every use.
+        num_vec: ArrTSym = ArrTSym(NUM_T, 1)
+        num_mat: ArrTSym = ArrTSym(NUM_T, 2)
+
+        SymTab.inst().update_kw_bulk([
+            (
+                'oMat',
+                Fun(MatFun.o_mat,
+                    FunTSym([NUM_T], num_mat)
+                    )
+            ),
+            (
+                'zMat',
+                Fun(MatFun.z_mat,
+                    FunTSym([NUM_T], num_mat)
+                    )
+            ),
+            (
+                'idMat',
+                Fun(MatFun.id_mat,
+                    FunTSym([NUM_T], num_mat)
+                    )
+            ),
+            (
+                'diagComp',
+                Fun(MatFun.diag_comp,
+                    FunTSym([num_mat, BOOL_T], num_vec),
+                    [('anti', 'F')])
+            ),
+            (
+                'diagMat',
+                Fun(MatFun.diag_mat,
+                    FunTSym([num_vec, BOOL_T], num_mat),
+                    [('anti', 'F')])
+            ),
+            (
+                'triComp',
+                Fun(MatFun.tri_comp,
+                    FunTSym([num_mat, BOOL_T, BOOL_T], num_mat),
+                    [('strict', 'T'), ('lower', 'T')]
+                    )
+            ),
+            (
+                'triMat',
+                Fun(MatFun.tri_mat,
+                    FunTSym([num_vec, BOOL_T, BOOL_T], num_mat),
+                    [('strict', 'T'), ('lower', 'T')]
+                    )
+            ),
+            (
+                'rbind',
+                Fun(MatFun.rbind,
+                    FunTSym([num_mat, num_mat], num_mat)
+                    )
+            ),
+            (
+                'cbind',
+                Fun(MatFun.cbind,
+                    FunTSym([num_mat, num_mat], num_mat)
+                    )
+            ),
+            (
+                't',
+                Fun(MatFun.t,
+                    FunTSym([num_mat], num_mat)
+                    )
+            ),
+            (
+                'lu',
+                Fun(MatFun.lu,
+                    FunTSym([num_mat, BOOL_T],
+                            StrtTSym({'L': num_mat, 'U': num_mat}))
+                    )
+            ),
+            # (
+            #     'lu__',
+            #     Fun(MatFun.lu__,
+            #         FunTSym([num_mat, BOOL_T],
+            #                 StrtTSym({'LU': num_mat, 'p': num_vec, 'q': num_vec,
+            #                           'flag': NUM_T}))
+            #         )
+            # ),
+            (
+                'chol',
+                Fun(MatFun.chol,
+                    FunTSym([num_mat], StrtTSym({'L': num_mat}))
+                    )
+            ),
+            # (
+            #     'chol__',
+            #     Fun(MatFun.chol__,
+            #         FunTSym([num_mat], StrtTSym({'L': num_mat, 'flag': NUM_T}))
+            #         )
+            # ),
+            (
+                'qr',
+                Fun(MatFun.qr,
+                    FunTSym([num_mat], StrtTSym({'Q': num_mat, 'R': num_mat}))
+                    )
+            ),
+            # (
+            #     'qr__',
+            #     Fun(MatFun.qr__,
+            #         FunTSym([num_mat],
+            #                 StrtTSym({'QR': num_mat, 'aux': num_vec, 'flag': NUM_T}))
+            #         )
+            # ),
+        ])
 
     @staticmethod
     def o_mat(n: int) -> Mat:
@@ -128,7 +135,11 @@ class MatFun:
         if n <= 0:
             raise FunErr(Errno.FUN_ERR, detail='nonpositive matrix dimension')
 
-        return Mat([Vec([1] * n) for _ in range(n)], [n, n])
+        # Rows are shallow copies of one template row rather than separately built lists.
+        # Elements are immutable ints, so shallow copy suffices and it is a single C level memcpy per row.
+        row: List[int] = [1] * n
+
+        return Mat([Vec(row.copy()) for _ in range(n)], [n, n])
 
     @staticmethod
     def z_mat(n: int) -> Mat:
@@ -137,7 +148,11 @@ class MatFun:
         if n <= 0:
             raise FunErr(Errno.FUN_ERR, detail='nonpositive matrix dimension')
 
-        return Mat([Vec([0] * n) for _ in range(n)], [n, n])
+        # Rows are shallow copies of one template row rather than separately built lists.
+        # Elements are immutable ints, so shallow copy suffices and it is a single C level memcpy per row.
+        row: List[int] = [0] * n
+
+        return Mat([Vec(row.copy()) for _ in range(n)], [n, n])
 
     @staticmethod
     def id_mat(n: int) -> Mat:
@@ -146,36 +161,45 @@ class MatFun:
         if n <= 0:
             raise FunErr(Errno.FUN_ERR, detail='nonpositive matrix dimension')
 
-        return MatFun.diag_mat(Vec([1] * n))
+        elem: List[Vec] = [None] * n
+
+        # Rows are built directly rather than through diag_mat, which needs a vector of ones to be built first.
+        for i in range(n):
+            row: List[int] = [0] * n
+            row[i] = 1
+            elem[i] = Vec(row)
+
+        return Mat(elem, [n, n])
 
     @staticmethod
     def diag_comp(m: Mat, anti: bool = False) -> Vec:
         n: int = m.ncol
-        elem: List = [None] * min(m.nrow, n)
+        # Column index of (anti-)diagonal entry for each row. Since zip stops at the shorter one,
+        # it yields exactly min(# of rows, # of columns) entries.
+        col: range = range(n - 1, -1, -1) if anti else range(n)
 
-        if anti:
-            for i in range(len(elem)):
-                elem[i] = m[i][n - i - 1]
-        else:
-            for i in range(len(elem)):
-                elem[i] = m[i][i]
-
-        return Vec(elem)
+        return Vec([row.elem[j] for row, j in zip(m.elem, col)])
 
     @staticmethod
     def diag_mat(v: Vec, anti: bool = False) -> Mat:
         if type(v) != Vec:
-            return MatFun.tri_mat(Vec([v]), anti)
+            # Base type is just a 1 by 1 matrix, which is both diagonal and anti-diagonal.
+            return Mat([Vec([v])], [1, 1])
 
         if len(v) == 0:
             raise FunErr(Errno.FUN_ERR, detail='empty element list')
 
         n: int = len(v)
+        elem: List[Vec] = [None] * n
 
-        if anti:
-            return Mat([Vec([0] * (n - i - 1) + [v[i]] + [0] * i) for i in range(n)], [n, n])
-        else:
-            return Mat([Vec([0] * i + [v[i]] + [0] * (n - i - 1)) for i in range(n)], [n, n])
+        # Each row is allocated once as zeros and then the diagonal entry is filled in place,
+        # rather than concatenating three partial lists.
+        for i in range(n):
+            row: List = [0] * n
+            row[n - i - 1 if anti else i] = v[i]
+            elem[i] = Vec(row)
+
+        return Mat(elem, [n, n])
 
     # TODO: Implement me
     @staticmethod
@@ -184,95 +208,84 @@ class MatFun:
 
     @staticmethod
     def tri_mat(v: Vec, strict: bool = True, lower: bool = True) -> Mat:
-        if type(v) != Vec:
-            return MatFun.tri_mat(Vec([v]), strict, lower)
+        # Base type is treated as a single element list rather than wrapped into vector.
+        v_elem: List = v.elem if type(v) == Vec else [v]
+        n: int = len(v_elem)
 
-        if strict:
-            if len(v) == 0:
-                return Mat([Vec([0])], [1, 1])
+        if n == 0 and not strict:
+            raise FunErr(Errno.FUN_ERR, detail='empty element list')
 
-            res: Mat = MatFun.tri_mat(v, False, lower)
-            n: int = res.ncol
+        # Side length of the triangle, solving k(k + 1) / 2 = n.
+        # Rows are built directly by index arithmetic, including zero padding for strict one,
+        # rather than binding zero row and column to the non-strict result.
+        k: int = (isqrt(8 * n + 1) - 1) // 2
 
-            if lower:
-                return Mat([Vec([0] * n)], [1, n]).rbind(res).cbind(Vec([0] * (n + 1)))
-            else:
-                return Mat([Vec([0]) for _ in range(n)], [n, 1]).cbind(res).rbind(Vec([0] * (n + 1)))
-        else:
-            if len(v) == 0:
-                raise FunErr(Errno.FUN_ERR, detail='empty element list')
+        if k * (k + 1) // 2 != n:
+            raise FunErr(Errno.FUN_ERR, detail='incompatible number of elements')
 
-            if lower:
-                elem: List = []
-                i, j = 0, 0
-                n: int = len(v)
+        sz: int = k + 1 if strict else k
+        elem: List[Vec] = [None] * sz
+        i_v: int = 0
 
-                while i < n:
-                    if i + j >= n:
-                        raise FunErr(Errno.FUN_ERR, detail='incompatible number of elements')
+        for i in range(sz):
+            # Number of elements from v in the i-th row.
+            m: int = i + 1 if lower else sz - i
 
-                    elem.append(v[i:(i + j + 1)])
-                    j += 1
-                    i += j
+            if strict:
+                m -= 1
 
-                for i in range(j):
-                    elem[i] = Vec(elem[i] + [0] * (j - i - 1))
+            if lower:
+                elem[i] = Vec(v_elem[i_v:(i_v + m)] + [0] * (sz - m))
             else:
-                elem_rev: List = []
-                i, j = 0, 0
-                n: int = len(v)
-
-                while i < n:
-                    if i + j >= n:
-                        raise FunErr(Errno.FUN_ERR, detail='incompatible number of elements')
+                elem[i] = Vec([0] * (sz - m) + v_elem[i_v:(i_v + m)])
 
-                    elem_rev.append(v[(n - i - j - 1):(n - i)])
-                    j += 1
-                    i += j
+            i_v += m
 
-                elem: List = [None] * j
-
-                for i in range(j):
-                    elem[j - i - 1] = Vec([0] * (j - i - 1) + elem_rev[i])
-
-            return Mat(elem, [j, j])
+        return Mat(elem, [sz, sz])
 
     @staticmethod
     def rbind(m: Mat, v: Mat) -> Mat:
-        if type(m) == Vec:
-            return MatFun.rbind(m.promote(1), v)
-        elif type(m) != Mat:
-            return MatFun.rbind(Vec([m]), v)
+        # Base types and vectors are lifted in place rather than by recursive calls.
+        m_t: type = type(m)
 
-        if type(v) == Vec:
-            if m.ncol != len(v):
-                raise FunErr(Errno.FUN_ERR,
-                             detail=f'dimension mismatch (cannot bind {v.dim} vector to {m.dim} matrix)')
+        if m_t == Vec:
+            m = m.promote(1)
+        elif m_t != Mat:
+            m = Vec([m]).promote(1)
 
-            return deepcopy(m).rbind(v)
-        elif type(v) == Mat:
+        v_t: type = type(v)
+
+        if v_t == Mat:
             if m.ncol != v.ncol:
                 raise FunErr(Errno.FUN_ERR,
                              detail=f'dimension mismatch (cannot bind {v.dim} matrix to {m.dim} matrix)')
-
-            return deepcopy(m).rbind(v)
         else:
-            return MatFun.rbind(m, Vec([v]))
+            if v_t != Vec:
+                v = Vec([v])
+
+            if m.ncol != len(v):
+                raise FunErr(Errno.FUN_ERR,
+                             detail=f'dimension mismatch (cannot bind {v.dim} vector to {m.dim} matrix)')
+
+        return m.rbind(v)
 
     @staticmethod
     def cbind(m: Mat, v: Mat) -> Mat:
-        if type(v) == int or type(v) == bool or type(v) == float:
-            return MatFun.cbind(m, Vec([v]))
+        v_t: type = type(v)
+
+        if v_t == int or v_t == bool or v_t == float:
+            v = Vec([v])
 
         if m.nrow != len(v):
             raise FunErr(Errno.FUN_ERR, detail=f'dimension mismatch (cannot bind {v.dim} vector to {m.dim} matrix)')
 
-        return deepcopy(m).cbind(v)
+        return m.cbind(v)
 
     @staticmethod
     def t(m: Mat) -> Mat:
         if type(m) == Mat:
-            return Mat([Vec([m[j][i] for j in range(m.nrow)]) for i in range(m.ncol)], [m.ncol, m.nrow])
+            # Transposition is done by zip at C level rather than by indexing each element.
+            return Mat([Vec(list(col)) for col in zip(*[row.elem for row in m.elem])], [m.ncol, m.nrow])
         if type(m) == Vec:
             return Mat([Vec([m[i]]) for i in range(len(m))], [len(m), 1])
         else:
@@ -286,15 +299,8 @@ class MatFun:
 
         if cp:
             m, p, q, flag = CLib.LU(m, cp, tol)
-            print(m.format(100, 100, 10))
-            print(p.format(100, 100, 10))
-            print(q.format(100, 100, 10))
-            print(flag)
         else:
             m, p, flag = CLib.LU(m, cp, tol)
-            print(m.format(100, 100, 10))
-            print(p.format(100, 100, 10))
-            print(flag)
 
         return m
 
@@ -305,8 +311,6 @@ class MatFun:
             raise NotImplementedError
 
         m, flag = CLib.CHOL(m, tol)
-        print(m.format(100, 100, 10))
-        print(flag)
 
         return m
 
@@ -316,9 +320,6 @@ class MatFun:
             raise NotImplementedError
 
         m, v, flag = CLib.QR(m, tol)
-        print(m.format(100, 100, 10))
-        print(v.format(100, 100, 10))
-        print(flag)
 
         return m
 
@@ -329,39 +330,3 @@ if __name__ == '__main__':
                   Vec([-1.0980232, -0.2293777, 1.1963730]),
                   Vec([-1.1304059, 1.7591313, -0.3715839]),
                   Vec([-2.7965343, 0.1173668, -0.1232602])], [5, 3])
-
-    # x=[[0.3769721, 0.7205735, -0.8531228],[0.3015484, 0.9391210, 0.9092592],[-1.0980232, -0.2293777, 1.1963730],[-1.1304059, 1.7591313, -0.3715839],[-2.7965343, 0.1173668, -0.1232602]]
-    # A = MatFun.t(A)
-    # m, n = 3, 5
-    # v: Vec = Vec([0] * m)
-    #
-    # for i in range(m):
-    #     norm = 0
-    #     s = -1 if A[i][i] < 0 else 1
-    #
-    #     for j in range(n - i):
-    #         norm += A[i][i + j] ** 2
-    #
-    #     norm = sqrt(norm)
-    #     u1 = A[i][i] + s * norm
-    #     v[i] = u1 / (s * norm)
-    #
-    #     for j in range(n - i - 1):
-    #         A[i][i + j + 1] /= u1
-    #
-    #     A[i][i] = -s * norm
-    #
-    #     for j in range(m - i - 1):
-    #         tmp = A[i + j + 1][i]
-    #
-    #         for k in range(n - i - 1):
-    #             tmp += A[i][i + k + 1] * A[i + j + 1][i + k + 1]
-    #
-    #         A[i + j + 1][i] -= tmp * v[i]
-    #
-    #         for k in range(n - i - 1):
-    #             A[i + j + 1][i + k + 1] -= tmp * A[i][i + k + 1] * v[i]
-    #     # print(A.format(100, 100, 10))
-    #
-    # print(MatFun.t(A).format(100, 100, 10))
-    # print(v.format(100, 100, 10))
@@ -15,11 +15,18 @@ from Class.Array import Mat
 if __name__ == '__main__':
     InitMan.inst().init()
 
+    reader: Reader = Reader.inst()
+    printer: Printer = Printer.inst()
+    parser: Parser = Parser.inst()
+    sem_chk: SemanticChk = SemanticChk.inst()
+    interp: Interp = Interp.inst()
+    interactive: bool = reader.src == sys.stdin
+
     while True:
-        if Reader.inst().src == sys.stdin:
-            Printer.inst().print('>> ', False)
+        if interactive:
+            printer.print('>> ', False)
 
-        line: str = Reader.inst().readline()
+        line: str = reader.readline()
 
         # Lexer.inst().test(line)
         # ast: AST = Parser.inst().parse(line)
@@ -27,14 +34,14 @@ if __name__ == '__main__':
         # Interp.inst().test(ast, line)
 
         try:
-            ast: AST = Parser.inst().parse(line)
+            ast: AST = parser.parse(line)
 
             if ast is None:
                 continue
 
-            ast = SemanticChk.inst().chk(ast, line)
-            res: str = Interp.inst().interp(ast, line)
+            ast = sem_chk.chk(ast, line)
+            res: str = interp.interp(ast, line)
         except Err as e:
-            Printer.inst().print(e.msg)
+            printer.print(e.msg)
         else:
-            Printer.inst().print(res)
+            printer.print(res)
@@ -39,6 +39,14 @@ class Printer:
         self.__w: Final[int] = w
         self.__h: Final[int] = h
         self.__it_w: Final[int] = it_w
+        # Formatting logic for base types, indexed by type.
+        # Objects of other types are formatted by their own format method.
+        self.__fmt_hndl: Final[Dict[type, Callable[[Any, int], str]]] = {
+            bool: self.__fmt_bool,
+            int: self.__fmt_num,
+            float: self.__fmt_num,
+            str: self.__fmt_str
+        }
 
     """
     UTILS
@@ -77,22 +85,34 @@ class Printer:
         if h <= 0:
             return ('', h) if h_remain else ''
 
-        if type(obj) == bool:
-            return ('[1] ' + str(obj), h - 1) if h_remain else '[1] ' + str(obj)
-        elif type(obj) == int or type(obj) == float:
-            v_str: str = str(obj)
+        hndl: Optional[Callable[[Any, int], str]] = self.__fmt_hndl.get(type(obj))
 
-            if len(v_str) > w:
-                v_str = v_str[:(w - 3)] + '...'
+        if hndl is None:
+            return obj.format(w, h, it_w, h_remain)
 
-            return ('[1] ' + v_str, h - 1) if h_remain else '[1] ' + v_str
-        elif type(obj) == str:
-            if len(obj) > w - 2:
-                obj = obj[:(w - 5)] + '...'
+        buf: str = hndl(obj, w)
 
-            return ('[1] "' + obj + '"', h - 1) if h_remain else '[1] "' + obj + '"'
-        else:
-            return obj.format(w, h, it_w, h_remain)
+        return (buf, h - 1) if h_remain else buf
+
+    @staticmethod
+    def __fmt_bool(obj: bool, w: int) -> str:
+        return '[1] ' + str(obj)
+
+    @staticmethod
+    def __fmt_num(obj: Union[int, float], w: int) -> str:
+        v_str: str = str(obj)
+
+        if len(v_str) > w:
+            v_str = v_str[:(w - 3)] + '...'
+
+        return '[1] ' + v_str
+
+    @staticmethod
+    def __fmt_str(obj: str, w: int) -> str:
+        if len(obj) > w - 2:
+            obj = obj[:(w - 5)] + '...'
+
+        return '[1] "' + obj + '"'
 
     """
     PRINT LOGIC
@@ -29,6 +29,10 @@ class Reader:
         :param src: Source. (Default: sys.stdin)
         """
         self.__src: Final[TextIO] = src
+        # Line iterator for non-interactive sources. Lines are pulled through iterator protocol,
+        # which reads ahead in blocks, rather than by a readline call per line.
+        # Stdin keeps using readline so that each line is read only after the prompt is printed.
+        self.__it: Final[Optional[Iterator[str]]] = None if src is sys.stdin else iter(src)
 
     """
     READING LOGIC
@@ -40,7 +44,10 @@ class Reader:
 
         :return: Read line.
         """
-        return self.__src.readline()
+        if self.__it is None:
+            return self.__src.readline()
+
+        return next(self.__it, '')
 
     """
     GETTERS & SETTERS